@@ -61,16 +61,56 @@ class RiskAgent:
         """
         logger.info(f"[RiskAgent] Assessing {len(candidates)} candidates")
         t_start = time.time()
+        use_triton = self._use_triton()
+        scores = [self._score_candidate(c, use_triton=use_triton) for c in candidates]
+        return self._decide(candidates, scores, t_start)
 
+    async def assess_async(self, candidates: List[CandidateResult]) -> RiskAssessment:
+        """
+        Same as assess(), but sends every candidate's Triton request at once so
+        the risk-scorer's dynamic batcher can score them in one execute().
+        """
+        logger.info(f"[RiskAgent] Assessing {len(candidates)} candidates")
+        t_start = time.time()
+        scores = None
+        if await self._use_triton_async():
+            try:
+                resps = await self.triton_client.infer_many(
+                    "risk-scorer",
+                    [self._triton_inputs(c) for c in candidates],
+                    outputs=("SCORES", "META"),
+                )
+                scores = [
+                    self._triton_score(resp) if resp.get("SCORES") else self._score_candidate_formula(c)
+                    for c, resp in zip(candidates, resps)
+                ]
+            except Exception as e:
+                logger.warning(f"[RiskAgent] Triton scoring failed, using formula: {e}")
+        if scores is None:
+            scores = [self._score_candidate_formula(c) for c in candidates]
+        return self._decide(candidates, scores, t_start)
+
+    def _use_triton(self) -> bool:
         # Decide once per cycle whether the Triton-served risk model is reachable,
         # rather than health-checking per candidate.
         use_triton = bool(self.triton_client) and self.triton_client.is_healthy()
         if use_triton:
             logger.info("[RiskAgent] scoring via Triton-served risk-scorer model")
+        return use_triton
+
+    async def _use_triton_async(self) -> bool:
+        # Same as _use_triton(), without blocking the event loop on the check
+        use_triton = bool(self.triton_client) and await self.triton_client.is_healthy_async()
+        if use_triton:
+            logger.info("[RiskAgent] scoring via Triton-served risk-scorer model")
+        return use_triton
 
+    def _decide(
+        self, candidates: List[CandidateResult], scores: List[float], t_start: float
+    ) -> RiskAssessment:
+        """Rank scored candidates and pick the deploy/reject/rollback action."""
         scored = []
-        for candidate in candidates:
-            score = self._score_candidate(candidate, use_triton=use_triton)
+        for candidate, score in zip(candidates, scores):
             candidate.confidence_score = score
             candidate.risk_score = 1.0 - score
             scored.append((candidate.candidate_id, score, candidate))
@@ -140,27 +180,34 @@ class RiskAgent:
         """
         if use_triton:
             try:
-                total_tests = (
-                    candidate.tests_passed + candidate.tests_failed + candidate.tests_errors
-                )
                 resp = self.triton_client.infer(
                     model_name="risk-scorer",
-                    inputs={
-                        "exploit_success_rate": candidate.exploit_success_rate,
-                        "tests_passed": candidate.tests_passed,
-                        "total_tests": max(total_tests, 1),
-                        "bandit_issues": candidate.bandit_issues,
-                        "model_confidence": candidate.plan.model_confidence,
-                    },
+                    inputs=self._triton_inputs(candidate),
+                    outputs=("SCORES", "META"),
                 )
-                score = resp.get("confidence_score")
-                if score is not None:
-                    return max(0.0, min(1.0, float(score)))
+                if resp.get("SCORES"):
+                    return self._triton_score(resp)
             except Exception as e:
                 logger.warning(f"[RiskAgent] Triton scoring failed, using formula: {e}")
 
         return self._score_candidate_formula(candidate)
 
+    @staticmethod
+    def _triton_inputs(candidate: CandidateResult) -> dict:
+        total_tests = candidate.tests_passed + candidate.tests_failed + candidate.tests_errors
+        return {
+            "exploit_success_rate": candidate.exploit_success_rate,
+            "tests_passed": candidate.tests_passed,
+            "total_tests": max(total_tests, 1),
+            "bandit_issues": candidate.bandit_issues,
+            "model_confidence": candidate.plan.model_confidence,
+        }
+
+    @staticmethod
+    def _triton_score(resp: dict) -> float:
+        # SCORES = [confidence, risk, security term, correctness term]
+        return max(0.0, min(1.0, float(resp["SCORES"][0])))
+
     def _score_candidate_formula(self, candidate: CandidateResult) -> float:
         """Local fallback score (used when Triton risk-scorer is unreachable)."""
         # Security: how often does exploit fail?
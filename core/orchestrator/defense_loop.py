@@ -236,7 +236,7 @@ class DefenseLoop:
         # ── Step 6: Risk assessment ───────────────────────────────────────
         t_risk = time.time()
         logger.info(f"[DefenseLoop] Step 6/6: Risk assessment...")
-        assessment = self.risk_agent.assess(cycle.candidates)
+        assessment = await self.risk_agent.assess_async(cycle.candidates)
         risk_latency_ms = (time.time() - t_risk) * 1000
         cycle.risk_inference_latency_ms = risk_latency_ms
 
@@ -17,13 +17,34 @@ Usage:
 """
 
 import json
+import logging
 import os
+import subprocess
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+import pandas as pd_std
 import streamlit as st
 
+try:
+    import fcntl
+except ImportError:  # non-POSIX: no cross-session lock, so no compaction
+    fcntl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
 # ─── Page Config ─────────────────────────────────────────────────────────────
 st.set_page_config(
     page_title="ZeroWall — AI Moving Target Defense",
@@ -61,8 +82,14 @@ st.markdown("""
 
 
 # ─── Sidebar ──────────────────────────────────────────────────────────────────
+@st.cache_resource
+def logo_svg() -> str:
+    """Bundled sidebar logo, read from disk once per server process."""
+    return (BASE_DIR / "dashboard" / "assets" / "logo.svg").read_text()
+
+
 with st.sidebar:
-    st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/2/21/Simple_English_Wikipedia_globe.svg/200px-Simple_English_Wikipedia_globe.svg.png", width=60)
+    st.image(logo_svg(), width=60)
     st.title("⚡ ZeroWall")
     st.caption("AI Moving Target Defense\nNVIDIA DGX Spark")
     st.divider()
@@ -85,20 +112,161 @@ st.divider()
 
 # ─── Helper: Load Data ───────────────────────────────────────────────────────
 
-def load_telemetry() -> list:
-    """Load all telemetry events."""
-    path = TELEMETRY_DIR / "telemetry.jsonl"
-    events = []
-    if path.exists():
-        with open(path) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        events.append(json.loads(line))
-                    except Exception:
-                        pass
-    return events
+# Columns kept from each telemetry event — everything the dashboard reads.
+# Projecting here keeps the frame N×2 however many keys an event carries.
+TELEMETRY_COLUMNS = ("metric", "value")
+
+# Parquet mirror of the JSONL prefix: typed columns the backend reads without
+# re-tokenizing. The mirror's own file metadata records how many JSONL bytes it
+# covers and how many malformed lines those bytes held, so data and counters
+# are replaced together in one rename.
+TELEMETRY_FILE = TELEMETRY_DIR / "telemetry.jsonl"
+PARQUET_MIRROR = TELEMETRY_DIR / "telemetry.parquet"
+PARQUET_LOCK = TELEMETRY_DIR / "telemetry.parquet.lock"
+PARQUET_OFFSET_KEY = b"zerowall.jsonl_offset"
+PARQUET_MALFORMED_KEY = b"zerowall.malformed_lines"
+PARQUET_COMPACT_ROWS = int(os.environ.get("TELEMETRY_PARQUET_COMPACT_ROWS", "500"))
+
+
+def _maybe_compact_to_parquet(
+    events: Dict[str, list],
+    mirror: Optional["pa.Table"],
+    start_offset: int,
+    end_offset: int,
+    malformed: int,
+) -> Optional["pa.Table"]:
+    """Fold the parsed JSONL tail into the Parquet mirror once enough rows pile up.
+
+    `mirror` is the table _read_mirror() returned for `start_offset`. Returns
+    the new mirror table if it now covers the tail (caller drops its rows),
+    else None. `malformed` is the running count of malformed lines up to
+    `end_offset`.
+    Non-numeric values (e.g. action labels) are stored as NaN — the dashboard
+    only aggregates numeric metrics. Needs pyarrow and fcntl; without them,
+    stays on JSONL. Concurrent sessions serialize on a lock file, and one that
+    loses the race (the mirror moved past `start_offset`) keeps its tail.
+    """
+    if len(events["metric"]) < PARQUET_COMPACT_ROWS or pq is None or fcntl is None:
+        return None
+    tmp = None
+    try:
+        with open(PARQUET_LOCK, "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return None  # another session is compacting right now
+            if _mirror_state(TELEMETRY_FILE.stat().st_size)[0] != start_offset:
+                return None
+            tail = pd_std.DataFrame(events)
+            tail["value"] = pd_std.to_numeric(tail["value"], errors="coerce")
+            df = pd_std.concat([mirror.to_pandas(), tail]) if mirror is not None else tail
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                PARQUET_OFFSET_KEY: str(end_offset).encode(),
+                PARQUET_MALFORMED_KEY: str(malformed).encode(),
+            })
+            fd, tmp = tempfile.mkstemp(dir=TELEMETRY_DIR, prefix=".telemetry.", suffix=".parquet.tmp")
+            os.close(fd)
+            pq.write_table(table, tmp)
+            os.replace(tmp, PARQUET_MIRROR)
+            tmp = None
+            return table
+    except (OSError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"[dashboard] Parquet compaction failed, staying on JSONL: {e}")
+        return None
+    finally:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def _mirror_state(jsonl_size: int) -> Tuple[int, int]:
+    """(JSONL byte offset, malformed lines) covered by the Parquet mirror.
+
+    (0, 0) if the mirror is missing or stale.
+    """
+    if pq is None or not PARQUET_MIRROR.exists():
+        return 0, 0
+    try:
+        metadata = pq.read_schema(PARQUET_MIRROR).metadata or {}
+        offset = int(metadata[PARQUET_OFFSET_KEY])
+        malformed = int(metadata.get(PARQUET_MALFORMED_KEY, b"0"))
+    except (OSError, KeyError, ValueError, pa.ArrowException):
+        return 0, 0
+    # A shorter JSONL than the mirror covers means it was rotated — start over.
+    return (offset, malformed) if offset <= jsonl_size else (0, 0)
+
+
+def _read_mirror(jsonl_size: int) -> Tuple[Optional["pa.Table"], int, int]:
+    """Read the Parquet mirror once: (table, JSONL offset, malformed lines).
+
+    Rows and counters come from the same read, under a shared lock, so a
+    concurrent compaction can't pair one version's rows with another's
+    offset. (None, 0, 0) if the mirror is missing, unreadable, or stale.
+    """
+    if pq is None or not PARQUET_MIRROR.exists():
+        return None, 0, 0
+    try:
+        with open(PARQUET_LOCK, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_SH)
+            table = pq.read_table(PARQUET_MIRROR, columns=list(TELEMETRY_COLUMNS))
+        metadata = table.schema.metadata or {}
+        offset = int(metadata[PARQUET_OFFSET_KEY])
+        malformed = int(metadata.get(PARQUET_MALFORMED_KEY, b"0"))
+    except (OSError, KeyError, ValueError, pa.ArrowException):
+        return None, 0, 0
+    # A shorter JSONL than the mirror covers means it was rotated — start over.
+    if offset > jsonl_size:
+        return None, 0, 0
+    return table, offset, malformed
+
+
+def load_telemetry() -> Tuple[Dict[str, list], Optional["pa.Table"], int]:
+    """Load telemetry as columns (dict-of-lists keyed by TELEMETRY_COLUMNS).
+
+    Only JSONL bytes past the Parquet mirror are parsed; the returned mirror
+    table (None if there is no mirror) holds the historical bulk, read once
+    together with the offset the tail starts from. The last element counts
+    malformed lines skipped across the whole JSONL: the mirror's persisted
+    count plus those in the parsed tail.
+    """
+    cols = {name: [] for name in TELEMETRY_COLUMNS}
+    if not TELEMETRY_FILE.exists():
+        return cols, None, 0
+
+    mirror, offset, malformed = _read_mirror(TELEMETRY_FILE.stat().st_size)
+    appenders = [(name, cols[name].append) for name in TELEMETRY_COLUMNS]
+    end_offset = offset
+    with open(TELEMETRY_FILE, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # writer is mid-line; pick it up next refresh
+            end_offset += len(line)
+            line = line.strip()
+            if not line:
+                continue
+            # Cheap shape check first: exceptions are the slow path in CPython
+            if line[:1] != b"{" or line[-1:] != b"}":
+                malformed += 1
+                continue
+            try:
+                ev = json.loads(line)
+            except ValueError:
+                malformed += 1
+                continue
+            for name, append in appenders:
+                append(ev.get(name))
+
+    compacted = _maybe_compact_to_parquet(cols, mirror, offset, end_offset, malformed)
+    if compacted is not None:
+        cols = {name: [] for name in TELEMETRY_COLUMNS}
+        mirror = compacted
+    return cols, mirror, malformed
 
 
 def load_manifest() -> Dict[str, Any]:
@@ -123,61 +291,193 @@ def load_benchmark() -> Dict[str, Any]:
     return {}
 
 
-def compute_analytics(events: list) -> Dict[str, Any]:
+@st.cache_resource
+def resolve_backend() -> Tuple[str, Any]:
+    """Pick the DataFrame backend once per server process: (label, module).
+
+    Streamlit re-executes this script on every refresh, so the choice (and the
+    cuDF import attempt) is cached as a resource rather than a module global.
+    """
+    if os.environ.get("RAPIDS_ENABLED", "true").lower() == "true":
+        try:
+            import cudf
+            return "cuDF-GPU", cudf
+        except ImportError:
+            pass
+    return "pandas-CPU", pd_std
+
+
+KPI_METRICS = (
+    "baseline_exploit_rate", "candidate_exploit_rate", "cycle_latency_s",
+    "candidate_count", "mutation_latency_ms", "risk_latency_ms",
+)
+
+
+def _streaming_aggs(events: Dict[str, list]) -> Dict[str, Any]:
+    """Dashboard aggregates in one pass over the columns — no DataFrame built.
+
+    Used while all telemetry is still an in-memory JSONL tail, where building a
+    frame (dtype inference, column hashing) costs more than the math itself.
+    """
+    sums = dict.fromkeys(KPI_METRICS, 0.0)
+    counts = dict.fromkeys(KPI_METRICS, 0)
+    rolling = deque(maxlen=20)
+    for m, v in zip(events["metric"], events["value"]):
+        if m in sums and isinstance(v, (int, float)):
+            sums[m] += v
+            counts[m] += 1
+            if m == "baseline_exploit_rate":
+                rolling.append(v)
+
+    def mean(metric_name, default=0.0):
+        return sums[metric_name] / counts[metric_name] if counts[metric_name] else default
+
+    return {
+        "exploit_before": round(mean("baseline_exploit_rate", 1.0), 4),
+        "exploit_after": round(mean("candidate_exploit_rate"), 4),
+        "avg_cycle_s": round(mean("cycle_latency_s"), 4),
+        "total_cycles": counts["cycle_latency_s"],
+        "total_candidates": int(sums["candidate_count"]),
+        "rolling_exploit": [round(r, 4) for r in rolling],
+        "avg_mutation_latency_ms": mean("mutation_latency_ms"),
+        "avg_risk_latency_ms": mean("risk_latency_ms"),
+    }
+
+
+def compute_analytics(events: Dict[str, list], mirror: Optional["pa.Table"] = None) -> Dict[str, Any]:
     """Compute analytics from telemetry events (pandas fallback)."""
     try:
-        rapids_enabled = os.environ.get("RAPIDS_ENABLED", "true").lower() == "true"
-        if rapids_enabled:
-            try:
-                import cudf as pd
-                backend = "cuDF-GPU"
-            except ImportError:
-                import pandas as pd
-                backend = "pandas-CPU"
-        else:
-            import pandas as pd
-            backend = "pandas-CPU"
+        backend, pd = resolve_backend()
 
-        if not events:
+        if not events["metric"] and mirror is None:
             return {"backend": backend}
 
-        df = pd.DataFrame(events)
-
-        def metric_vals(metric_name):
-            try:
-                mask = df["metric"] == metric_name
-                vals = df[mask]["value"].astype(float)
-                return list(vals)
-            except Exception:
-                return []
-
-        baseline_rates = metric_vals("baseline_exploit_rate")
-        candidate_rates = metric_vals("candidate_exploit_rate")
-        cycle_latencies = metric_vals("cycle_latency_s")
-        candidate_counts = metric_vals("candidate_count")
+        # Small logs with no Parquet history: the plain-Python scan is cheaper
+        if mirror is None and len(events["metric"]) < PARQUET_COMPACT_ROWS:
+            return {"backend": backend, **_streaming_aggs(events)}
 
-        def safe_avg(lst):
-            return round(sum(lst) / len(lst), 4) if lst else 0.0
+        # Columnar input: pandas/cuDF build each column directly, no per-row dict inference
+        df = pd.DataFrame(events)
+        if mirror is not None:
+            # Historical bulk (the Arrow table load_telemetry read, copied to the
+            # GPU under cuDF) + fresh JSONL tail
+            hist = pd.DataFrame.from_arrow(mirror) if backend == "cuDF-GPU" else mirror.to_pandas()
+            df = pd.concat([hist, df], ignore_index=True)
+
+        # float32 values: every reduction below is a single vectorized C pass
+        df["value"] = pd.to_numeric(df["value"], errors="coerce", downcast="float")
+        per_metric = df.groupby("metric")["value"].agg(["mean", "count", "sum"])
+        rolling = df.loc[df["metric"] == "baseline_exploit_rate", "value"].tail(20)
+        if hasattr(per_metric, "to_pandas"):
+            per_metric, rolling = per_metric.to_pandas(), rolling.to_pandas()
+
+        def stat(metric_name, column, default=0.0):
+            if metric_name not in per_metric.index or not per_metric.at[metric_name, "count"]:
+                return default
+            return float(per_metric.at[metric_name, column])
 
         return {
             "backend": backend,
-            "exploit_before": safe_avg(baseline_rates) if baseline_rates else 1.0,
-            "exploit_after": safe_avg(candidate_rates),
-            "avg_cycle_s": safe_avg(cycle_latencies),
-            "total_cycles": len(cycle_latencies),
-            "total_candidates": int(sum(candidate_counts)) if candidate_counts else 0,
-            "rolling_exploit": [round(r, 4) for r in baseline_rates[-20:]],
-            "cycle_latencies": cycle_latencies,
+            "exploit_before": round(stat("baseline_exploit_rate", "mean", 1.0), 4),
+            "exploit_after": round(stat("candidate_exploit_rate", "mean"), 4),
+            "avg_cycle_s": round(stat("cycle_latency_s", "mean"), 4),
+            "total_cycles": int(stat("cycle_latency_s", "count")),
+            "total_candidates": int(stat("candidate_count", "sum")),
+            "rolling_exploit": [round(float(r), 4) for r in rolling],
+            "avg_mutation_latency_ms": stat("mutation_latency_ms", "mean"),
+            "avg_risk_latency_ms": stat("risk_latency_ms", "mean"),
         }
     except Exception as e:
         return {"backend": "error", "error": str(e)}
 
 
+HISTORY_COLUMNS = [
+    "version_id", "transform_type", "tests_passed", "exploit_success_rate", "confidence_score", "cycle_id",
+]
+
+
+@st.cache_data
+def format_history(active_hash: Optional[str], n_entries: int, _history: list) -> "pd_std.DataFrame":
+    """Deployment history table with display-formatted percentages.
+
+    The manifest history only changes when a new version deploys, so the cache
+    is keyed on (active_hash, n_entries); `_history` is excluded from hashing.
+    """
+    df = pd_std.DataFrame(_history)[HISTORY_COLUMNS]
+    # Entries may lack a value (None/NaN); show a dash instead of failing the table
+    df["exploit_success_rate"] = df["exploit_success_rate"].map(lambda v: "—" if pd_std.isna(v) else f"{v:.0%}")
+    df["confidence_score"] = df["confidence_score"].map(lambda v: "—" if pd_std.isna(v) else f"{v:.1%}")
+    return df
+
+
+GPU_QUERY = [
+    "nvidia-smi",
+    "--query-gpu=name,utilization.gpu,memory.used,memory.total,temperature.gpu",
+    "--format=csv,noheader",
+]
+GPU_SAMPLE_INTERVAL_S = 5.0
+
+
+class GpuSampler:
+    """Polls nvidia-smi off the render path and keeps pre-split rows.
+
+    Each row is (name, util, mem_used, mem_total, temp). The render loop only
+    reads `stats`; the fork/exec and CSV splitting happen once per sample.
+    A failed sample sets `error` and keeps the last rows; polling continues
+    and the next good sample clears it.
+    """
+
+    def __init__(self, interval_s: float = GPU_SAMPLE_INTERVAL_S):
+        self.interval_s = interval_s
+        self.stats: List[Tuple[str, ...]] = []
+        self.error: Optional[str] = None
+        self._sample()  # first sample inline so the first render has data
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _sample(self) -> None:
+        try:
+            result = subprocess.run(GPU_QUERY, capture_output=True, text=True, timeout=3)
+        except Exception:
+            self.error = "nvidia-smi metrics not available — run on DGX Spark"
+            return
+        if result.returncode != 0:
+            self.error = "nvidia-smi not available in this environment"
+            return
+        rows = []
+        for line in result.stdout.strip().split("\n"):
+            parts = tuple(p.strip() for p in line.split(","))
+            if len(parts) >= 4:
+                rows.append(parts)
+        self.stats = rows
+        self.error = None
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval_s)
+            self._sample()
+
+
+@st.cache_resource
+def get_gpu_sampler() -> GpuSampler:
+    """One sampler thread per server process, shared by all sessions."""
+    return GpuSampler()
+
+
+@st.cache_resource
+def io_pool() -> ThreadPoolExecutor:
+    """Shared pool for the three independent file loads at the top of each run."""
+    return ThreadPoolExecutor(max_workers=3, thread_name_prefix="dashboard-io")
+
+
 # ─── Load All Data ────────────────────────────────────────────────────────────
-events = load_telemetry()
-manifest = load_manifest()
-benchmark = load_benchmark()
-analytics = compute_analytics(events)
+# Independent files: overlap their blocking reads instead of paying them in series
+fut_telemetry = io_pool().submit(load_telemetry)
+fut_manifest = io_pool().submit(load_manifest)
+fut_benchmark = io_pool().submit(load_benchmark)
+events, telemetry_mirror, malformed_lines = fut_telemetry.result()
+manifest = fut_manifest.result()
+benchmark = fut_benchmark.result()
+analytics = compute_analytics(events, telemetry_mirror)
 
 # ─── Row 1: Status Banners ────────────────────────────────────────────────────
 col1, col2, col3, col4 = st.columns(4)
@@ -224,13 +524,8 @@ with col_a:
     st.subheader("📋 Deployment History")
     history = manifest.get("history", [])
     if history:
-        import pandas as pd_std
-        df_display = pd_std.DataFrame(history)[
-            ["version_id", "transform_type", "tests_passed", "exploit_success_rate", "confidence_score", "cycle_id"]
-        ] if history else pd_std.DataFrame()
+        df_display = format_history(manifest.get("active_hash"), len(history), history)
         if not df_display.empty:
-            df_display["exploit_success_rate"] = df_display["exploit_success_rate"].apply(lambda x: f"{x:.0%}")
-            df_display["confidence_score"] = df_display["confidence_score"].apply(lambda x: f"{x:.1%}")
             st.dataframe(df_display, use_container_width=True, hide_index=True)
         else:
             st.info("No deployments yet. Run `/defend` in OpenClaw CLI.")
@@ -244,13 +539,12 @@ with col_b:
     st.markdown(f"**Backend:** {backend_color} `{backend}`")
     st.markdown(f"**Total Candidates Evaluated:** `{analytics.get('total_candidates', 0)}`")
     st.markdown(f"**Exploit Reduction:** `{(exploit_before - exploit_after):.0%}`")
+    st.markdown(f"**Malformed Telemetry Lines:** `{malformed_lines}`")
 
     # Rolling exploit rate chart
     rolling = analytics.get("rolling_exploit", [])
     if rolling:
-        import pandas as pd_std
-        chart_data = pd_std.DataFrame({"Exploit Rate": rolling})
-        st.line_chart(chart_data, height=120)
+        st.line_chart(np.asarray(rolling, dtype=np.float32), height=120)
     else:
         st.caption("No data yet — run a defense cycle to see trends")
 
@@ -260,18 +554,12 @@ st.divider()
 st.subheader("🧠 Inference Latency (NVIDIA Stack)")
 inf_col1, inf_col2, inf_col3 = st.columns(3)
 
-def get_metric_vals(events, metric_name):
-    return [e["value"] for e in events if e.get("metric") == metric_name and isinstance(e.get("value"), (int, float))]
-
-mutation_lats = get_metric_vals(events, "mutation_latency_ms")
-risk_lats = get_metric_vals(events, "risk_latency_ms")
-
 with inf_col1:
-    avg_mut = sum(mutation_lats) / len(mutation_lats) if mutation_lats else 0
+    avg_mut = analytics.get("avg_mutation_latency_ms", 0.0)
     st.metric("Triton: Mutation Planner", f"{avg_mut:.0f}ms", delta="avg latency")
 
 with inf_col2:
-    avg_risk = sum(risk_lats) / len(risk_lats) if risk_lats else 0
+    avg_risk = analytics.get("avg_risk_latency_ms", 0.0)
     st.metric("Triton: Risk Scorer", f"{avg_risk:.0f}ms", delta="avg latency")
 
 with inf_col3:
@@ -315,24 +603,12 @@ with gpu_col1:
         st.image(str(gpu_stats_path), caption="DGX GPU Utilization")
 
 with gpu_col2:
-    # Try to get live nvidia-smi stats if available
-    try:
-        import subprocess
-        result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=name,utilization.gpu,memory.used,memory.total,temperature.gpu",
-             "--format=csv,noheader"],
-            capture_output=True, text=True, timeout=3
-        )
-        if result.returncode == 0:
-            lines = result.stdout.strip().split("\n")
-            for i, line in enumerate(lines[:4]):
-                parts = [p.strip() for p in line.split(",")]
-                if len(parts) >= 4:
-                    st.metric(f"GPU {i}", parts[1], delta=f"{parts[2]} used")
-        else:
-            st.caption("nvidia-smi not available in this environment")
-    except Exception:
-        st.caption("nvidia-smi metrics not available — run on DGX Spark")
+    # Live nvidia-smi stats, sampled in the background
+    gpu_sampler = get_gpu_sampler()
+    if gpu_sampler.error:
+        st.caption(gpu_sampler.error)
+    for i, row in enumerate(gpu_sampler.stats[:4]):
+        st.metric(f"GPU {i}", row[1], delta=f"{row[2]} used")
 
 st.divider()
 
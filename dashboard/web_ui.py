@@ -11,17 +11,57 @@ Usage:
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import logging
 import os
 import time
 import uuid
+import zlib
+from array import array
+from collections import deque
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import uvicorn
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
+
+# orjson (C extension) for the JSONL, WebSocket and API hot paths, stdlib fallback
+try:
+    from orjson import dumps as json_dumpb, loads as json_loads
+    APIResponse = ORJSONResponse
+except ImportError:
+    json_loads = json.loads
+    APIResponse = JSONResponse
+
+    def json_dumpb(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# MessagePack for WebSocket frames (floats travel as 9 bytes instead of text);
+# JSON frames when ormsgpack isn't installed. The browser accepts either.
+try:
+    from ormsgpack import packb as ws_pack
+    WS_MSGPACK = True
+except ImportError:
+    ws_pack = json_dumpb
+    WS_MSGPACK = False
+
+# uvloop and httptools ship with uvicorn[standard]; the pure-Python fallbacks
+# keep dev boxes without them working
+try:
+    import uvloop  # noqa: F401
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    HTTP_IMPL = "httptools"
+except ImportError:
+    HTTP_IMPL = "h11"
 
 # ── Paths ────────────────────────────────────────────────────────────────────
 BASE_DIR = Path(__file__).parent.parent
@@ -32,34 +72,101 @@ TARGET_SOURCE = BASE_DIR / "apps" / "target-fastapi" / "main.py"
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("zerowall.webui")
 
-app = FastAPI(title="ZeroWall Visual Dashboard")
+app = FastAPI(title="ZeroWall Visual Dashboard", default_response_class=APIResponse)
 
 # ── Connected WebSocket clients ──────────────────────────────────────────────
-ws_clients: List[WebSocket] = []
+# Each client gets a bounded outgoing queue drained by its own sender task, so
+# broadcasting never waits on a socket. A client whose queue fills is dropped.
+ws_clients: Dict[WebSocket, asyncio.Queue] = {}
+WS_QUEUE_MAXSIZE = 256
+# Topic -> subscribed sockets. "steps" carries cycle_start/step_* progress,
+# "history" carries cycle_complete, "stats" carries refreshed /api/stats
+# snapshots. New clients get every topic until they send a subscribe message.
+WS_TOPICS = ("steps", "stats", "history")
+ws_by_topic: Dict[str, set] = {topic: set() for topic in WS_TOPICS}
+# Broadcasts at least this large go out zlib-compressed (first byte 0x78, which
+# starts neither a JSON nor a MessagePack message), compressed once and shared
+# by every client.
+WS_COMPRESS_MIN_BYTES = 512
+# A send slower than this counts as a strike; a client is evicted after
+# WS_SEND_MAX_STRIKES consecutive strikes.
+WS_SEND_TIMEOUT_S = 1.0
+WS_SEND_MAX_STRIKES = 3
+PONG = ws_pack({"type": "pong"})
 
 
 # ── Data loaders ─────────────────────────────────────────────────────────────
 
+class _TelemetryTail:
+    """Incremental JSONL decoder: feed raw bytes, get back complete records.
+
+    A trailing partial line stays buffered until its newline arrives. Lines are
+    located with bytearray.find and the consumed prefix is dropped once per
+    feed, so cost stays linear in bytes fed however the input is chunked.
+    """
+
+    def __init__(self):
+        self.buf = bytearray()
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        buf = self.buf
+        buf.extend(chunk)
+        records = []
+        start = 0
+        while (idx := buf.find(b"\n", start)) != -1:
+            line = bytes(buf[start:idx])
+            start = idx + 1
+            if line.strip():
+                try:
+                    records.append(json_loads(line))
+                except ValueError:
+                    pass
+        del buf[:start]
+        return records
+
+
+# Parsed telemetry keyed by (mtime_ns, size): polls of an unchanged file are O(1),
+# and a grown file only has its appended bytes (from "offset" onward) fed to the tail.
+_TELEMETRY_CACHE: Dict[str, Any] = {"key": None, "events": [], "offset": 0, "tail": _TelemetryTail()}
+
+
 def load_telemetry() -> List[Dict[str, Any]]:
-    events = []
-    if TELEMETRY_FILE.exists():
-        with open(TELEMETRY_FILE) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        pass
-    return events
+    cache = _TELEMETRY_CACHE
+    try:
+        st = TELEMETRY_FILE.stat()
+    except FileNotFoundError:
+        cache.update(key=None, events=[], offset=0, tail=_TelemetryTail())
+        return []
+    key = (st.st_mtime_ns, st.st_size)
+    if key == cache["key"]:
+        return cache["events"]
+    if st.st_size <= cache["offset"]:
+        # Truncated, rotated or rewritten in place — start from scratch
+        cache.update(events=[], offset=0, tail=_TelemetryTail())
+
+    with open(TELEMETRY_FILE, "rb") as f:
+        f.seek(cache["offset"])
+        data = f.read()
+    cache["events"].extend(cache["tail"].feed(data))
+    cache.update(key=key, offset=cache["offset"] + len(data))
+    return cache["events"]
+
+
+# Parsed manifest keyed by (mtime_ns, size); it only changes on deploy
+_MANIFEST_CACHE: Dict[str, Any] = {"key": None, "manifest": None}
 
 
 def load_manifest() -> Dict[str, Any]:
-    if DEPLOY_MANIFEST.exists():
-        try:
-            return json.loads(DEPLOY_MANIFEST.read_text())
-        except Exception:
-            pass
+    try:
+        st = DEPLOY_MANIFEST.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if key == _MANIFEST_CACHE["key"]:
+            return _MANIFEST_CACHE["manifest"]
+        manifest = json_loads(DEPLOY_MANIFEST.read_bytes())
+        _MANIFEST_CACHE.update(key=key, manifest=manifest)
+        return manifest
+    except Exception:
+        pass
     return {
         "active_version_id": "v1.0.0-ORIGINAL",
         "active_hash": "aabbcc001122",
@@ -67,6 +174,23 @@ def load_manifest() -> Dict[str, Any]:
     }
 
 
+# Metrics summarized by /api/stats -> how many trailing values it returns (0 = none).
+# Every metric keeps a running (sum, count); only tails are buffered, in bounded deques.
+STATS_TAILS = {
+    "baseline_exploit_rate": 0,
+    "candidate_exploit_rate": 30,
+    "cycle_latency_s": 20,
+    "candidate_count": 0,
+    "mutation_latency_ms": 20,
+    "risk_latency_ms": 20,
+    "candidate_confidence": 30,
+}
+
+# Above this many events compute_stats switches to array buffers + NumPy reductions;
+# below it the NumPy call overhead outweighs the win.
+STATS_NUMPY_MIN_EVENTS = 2000
+
+
 def compute_stats(events: List[Dict]) -> Dict[str, Any]:
     if not events:
         return {
@@ -83,98 +207,249 @@ def compute_stats(events: List[Dict]) -> Dict[str, Any]:
             "actions": {},
         }
 
-    def vals(metric):
-        return [
-            e["value"]
-            for e in events
-            if e.get("metric") == metric and isinstance(e.get("value"), (int, float))
-        ]
-
-    def avg(lst):
-        return sum(lst) / len(lst) if lst else 0.0
-
-    baseline = vals("baseline_exploit_rate")
-    cand_rates = vals("candidate_exploit_rate")
-    cycle_lats = vals("cycle_latency_s")
-    cand_counts = vals("candidate_count")
-    mut_lats = vals("mutation_latency_ms")
-    risk_lats = vals("risk_latency_ms")
-    cand_conf = vals("candidate_confidence")
+    if len(events) > STATS_NUMPY_MIN_EVENTS:
+        return _compute_stats_arrays(events)
 
+    # One pass over the events; memory is O(tail length), not O(events)
+    sums = dict.fromkeys(STATS_TAILS, 0.0)
+    counts = dict.fromkeys(STATS_TAILS, 0)
+    tails = {m: deque(maxlen=n) for m, n in STATS_TAILS.items() if n}
+    actions = {}
+    for e in events:
+        m = e.get("metric")
+        if m == "cycle_action":
+            a = e.get("value", "unknown")
+            actions[a] = actions.get(a, 0) + 1
+            continue
+        if m in sums:
+            v = e.get("value")
+            if isinstance(v, (int, float)):
+                sums[m] += v
+                counts[m] += 1
+                tail = tails.get(m)
+                if tail is not None:
+                    tail.append(v)
+
+    def avg(metric, default=0.0):
+        return sums[metric] / counts[metric] if counts[metric] else default
+
+    return _stats_payload(avg, counts, sums, lambda m: list(tails[m]), actions)
+
+
+def _compute_stats_arrays(events: List[Dict]) -> Dict[str, Any]:
+    """compute_stats for long histories: the scan only appends to contiguous
+    float64 buffers, and sums/means/tails are NumPy reductions over them."""
+    bufs = {m: array("d") for m in STATS_TAILS}
     actions = {}
     for e in events:
-        if e.get("metric") == "cycle_action":
+        m = e.get("metric")
+        if m == "cycle_action":
             a = e.get("value", "unknown")
             actions[a] = actions.get(a, 0) + 1
+            continue
+        buf = bufs.get(m)
+        if buf is not None:
+            v = e.get("value")
+            if isinstance(v, (int, float)):
+                buf.append(v)
+
+    vals = {m: np.frombuffer(buf, dtype=np.float64) for m, buf in bufs.items()}
+    counts = {m: v.size for m, v in vals.items()}
+    sums = {m: float(v.sum()) for m, v in vals.items()}
+
+    def avg(metric, default=0.0):
+        return float(vals[metric].mean()) if counts[metric] else default
+
+    def tail(metric):
+        return vals[metric][-STATS_TAILS[metric]:].tolist()
+
+    return _stats_payload(avg, counts, sums, tail, actions)
+
 
+def _stats_payload(avg, counts, sums, tail, actions) -> Dict[str, Any]:
     return {
-        "total_cycles": len(cycle_lats),
-        "total_candidates": int(sum(cand_counts)) if cand_counts else 0,
-        "exploit_before": avg(baseline) if baseline else 1.0,
-        "exploit_after": avg(cand_rates) if cand_rates else 0.0,
-        "avg_cycle_s": round(avg(cycle_lats), 2),
-        "mutation_latencies": mut_lats[-20:],
-        "risk_latencies": risk_lats[-20:],
-        "cycle_latencies": cycle_lats[-20:],
-        "candidate_confidences": cand_conf[-30:],
-        "candidate_exploit_rates": cand_rates[-30:],
+        "total_cycles": counts["cycle_latency_s"],
+        "total_candidates": int(sums["candidate_count"]),
+        "exploit_before": avg("baseline_exploit_rate", 1.0),
+        "exploit_after": avg("candidate_exploit_rate"),
+        "avg_cycle_s": round(avg("cycle_latency_s"), 2),
+        "mutation_latencies": tail("mutation_latency_ms"),
+        "risk_latencies": tail("risk_latency_ms"),
+        "cycle_latencies": tail("cycle_latency_s"),
+        "candidate_confidences": tail("candidate_confidence"),
+        "candidate_exploit_rates": tail("candidate_exploit_rate"),
         "actions": actions,
     }
 
 
+# ── Precomputed stats ───────────────────────────────────────────────────────
+# /api/stats serves this snapshot; a background loop rebuilds and pushes it
+# every STATS_REFRESH_S seconds, and each cycle does so right after writing
+# its telemetry.
+STATS_REFRESH_S = 2.0
+_stats_snapshot: Dict[str, Any] = {"stats": compute_stats([]), "manifest": {}, "telemetry_count": 0}
+# Strong references to fire-and-forget tasks; the loop itself only keeps weak ones
+_background_tasks: set = set()
+# The telemetry tail cache isn't safe to feed from two threads at once
+_stats_lock = asyncio.Lock()
+
+
+def _load_stats_inputs():
+    return load_telemetry(), load_manifest()
+
+
+async def refresh_stats():
+    # File IO runs in a worker thread (one hop for both files) so large
+    # telemetry reads never block WebSocket traffic on the loop.
+    async with _stats_lock:
+        events, manifest = await asyncio.to_thread(_load_stats_inputs)
+    _stats_snapshot.update(
+        stats=compute_stats(events),
+        manifest=manifest,
+        telemetry_count=len(events),
+    )
+
+
+async def publish_stats():
+    await refresh_stats()
+    if ws_by_topic["stats"]:
+        broadcast({"type": "stats", **_stats_snapshot}, topic="stats")
+
+
+async def stats_refresh_loop():
+    while True:
+        await asyncio.sleep(STATS_REFRESH_S)
+        try:
+            await publish_stats()
+        except Exception as e:
+            logger.error("Stats refresh failed: %s", e)
+
+
 # ── WebSocket broadcast ─────────────────────────────────────────────────────
 
-async def broadcast(msg: Dict):
-    dead = []
-    for ws in ws_clients:
+def _spawn(coro) -> asyncio.Task:
+    """create_task() that holds the task in _background_tasks until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def subscribe(ws: WebSocket, topics) -> None:
+    wanted = {topic for topic in topics if isinstance(topic, str)}
+    for topic, members in ws_by_topic.items():
+        if topic in wanted:
+            members.add(ws)
+        else:
+            members.discard(ws)
+
+
+def _drop_client(ws: WebSocket) -> None:
+    ws_clients.pop(ws, None)
+    for members in ws_by_topic.values():
+        members.discard(ws)
+
+
+def _frame(raw: bytes) -> bytes:
+    return zlib.compress(raw, 1) if len(raw) >= WS_COMPRESS_MIN_BYTES else raw
+
+
+def _pack_batch(raws: List[bytes]) -> bytes:
+    """Join already-encoded messages into one encoded array without re-encoding."""
+    if not WS_MSGPACK:
+        return b"[" + b",".join(raws) + b"]"
+    n = len(raws)
+    head = bytes((0x90 | n,)) if n < 16 else b"\xdc" + n.to_bytes(2, "big")
+    return head + b"".join(raws)
+
+
+def broadcast(msg: Dict, topic: str):
+    # Serialize once, enqueue to the topic's subscribers: no await, so a slow
+    # client can't stall the defense cycle's timing. Queue items are
+    # (encoded message, ready-to-send frame) so the pump can also batch them.
+    members = ws_by_topic[topic]
+    if not members:
+        return
+    raw = ws_pack(msg)
+    item = (raw, _frame(raw))
+    for ws in list(members):
+        queue = ws_clients.get(ws)
+        if queue is None:
+            continue
         try:
-            await ws.send_json(msg)
-        except Exception:
-            dead.append(ws)
-    for ws in dead:
-        ws_clients.remove(ws)
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning("Dropping WebSocket client: %d messages backed up", queue.qsize())
+            _drop_client(ws)
+            _spawn(ws.close(code=1013))
 
 
-# ── Simulated defense cycle (runs the real pipeline if available) ────────────
+async def _pump(ws: WebSocket, queue: asyncio.Queue):
+    """Sender task for one client: drains its queue onto the socket.
 
-async def run_simulated_cycle():
-    """Run a simulated defense cycle with realistic timing and broadcast events."""
-    cycle_id = str(uuid.uuid4())[:8]
-    t0 = time.time()
+    Whatever piled up while the previous send was in flight goes out as one
+    array frame instead of one frame per message.
+    """
+    strikes = 0
+    try:
+        while True:
+            raw, payload = await queue.get()
+            if not queue.empty():
+                raws = [raw]
+                while not queue.empty():
+                    raws.append(queue.get_nowait()[0])
+                payload = _frame(_pack_batch(raws))
+            try:
+                await asyncio.wait_for(ws.send_bytes(payload), timeout=WS_SEND_TIMEOUT_S)
+                strikes = 0
+            except asyncio.TimeoutError:
+                strikes += 1
+                if strikes >= WS_SEND_MAX_STRIKES:
+                    logger.warning("Dropping WebSocket client: %d sends timed out", strikes)
+                    _drop_client(ws)
+                    _spawn(ws.close(code=1013))
+                    return
+    except Exception:
+        _drop_client(ws)
 
-    steps = [
-        {
-            "step": 1,
-            "name": "Baseline Measurement",
-            "agent": "exploit_agent",
-            "detail": "Replaying 5 known payloads against original app...",
-            "duration": 0.8,
-            "result": {"baseline_exploit_rate": 1.0, "payloads_tested": 5},
-        },
-        {
-            "step": 2,
-            "name": "Mutation Generation",
-            "agent": "mutation_agent",
-            "detail": "Triton mutation-planner selecting transform types...",
-            "duration": 0.6,
-            "result": {"candidates_generated": 10, "transforms": [
-                "swap_validators", "swap_validators", "swap_validators",
-                "rename_identifiers", "rename_identifiers",
-                "route_rotation", "route_rotation",
-                "reorder_blocks", "split_helpers", "swap_validators",
-            ]},
-        },
-        {
-            "step": 3,
-            "name": "Apply Transforms",
-            "agent": "transform_engine",
-            "detail": "libcst AST transforms: swap_validators, rename_ids, route_rotation...",
-            "duration": 0.4,
-            "result": {
-                "transforms_applied": 10,
-                "failures": 0,
-                "transform_type": "swap_validators",
-                "code_before": """@app.get('/data')
+
+# ── Simulated defense cycle (runs the real pipeline if available) ────────────
+
+# Static per-step script for the simulated cycle, built once at import. Candidate
+# ids carry a "{cycle_id}" placeholder filled in per cycle by _bind_step_result.
+_STEP_TEMPLATES = [
+    {
+        "step": 1,
+        "name": "Baseline Measurement",
+        "agent": "exploit_agent",
+        "detail": "Replaying 5 known payloads against original app...",
+        "duration": 0.8,
+        "result": {"baseline_exploit_rate": 1.0, "payloads_tested": 5},
+    },
+    {
+        "step": 2,
+        "name": "Mutation Generation",
+        "agent": "mutation_agent",
+        "detail": "Triton mutation-planner selecting transform types...",
+        "duration": 0.6,
+        "result": {"candidates_generated": 10, "transforms": [
+            "swap_validators", "swap_validators", "swap_validators",
+            "rename_identifiers", "rename_identifiers",
+            "route_rotation", "route_rotation",
+            "reorder_blocks", "split_helpers", "swap_validators",
+        ]},
+    },
+    {
+        "step": 3,
+        "name": "Apply Transforms",
+        "agent": "transform_engine",
+        "detail": "libcst AST transforms: swap_validators, rename_ids, route_rotation...",
+        "duration": 0.4,
+        "result": {
+            "transforms_applied": 10,
+            "failures": 0,
+            "transform_type": "swap_validators",
+            "code_before": """@app.get('/data')
 async def get_data(path: str):
     # No path validation
     return open(path).read()
@@ -188,7 +463,7 @@ async def run_cmd(cmd: str):
 def validate_input(val: str) -> bool:
     # Weak validator — no sanitization
     return len(val) > 0""",
-                "code_after": """@app.get('/data')
+            "code_after": """@app.get('/data')
 async def get_data(path: str):
     # Path confined to safe directory
     safe = Path('/safe/data') / Path(path).name
@@ -208,131 +483,178 @@ async def run_cmd(cmd: str):
 def validate_input_v2(val: str) -> bool:
     # Strict regex — alphanumeric + dash only
     return bool(re.match(r'^[a-zA-Z0-9\\-]{1,64}$', val))""",
-            },
         },
-        {
-            "step": 4,
-            "name": "Verification",
-            "agent": "verifier_agent",
-            "detail": "Running pytest (25 tests) + bandit on each candidate...",
-            "duration": 1.5,
-            "result": {
-                "candidates_tested": 10,
-                "passing": 8,
-                "failing": 2,
-                "candidates": [
-                    {"id": f"candidate-{cycle_id}-{i:03d}", "tests_passed": 25 if i < 8 else 20,
-                     "tests_failed": 0 if i < 8 else 5, "bandit_issues": 0,
-                     "verifier_pass": i < 8}
-                    for i in range(10)
-                ],
-            },
+    },
+    {
+        "step": 4,
+        "name": "Verification",
+        "agent": "verifier_agent",
+        "detail": "Running pytest (25 tests) + bandit on each candidate...",
+        "duration": 1.5,
+        "result": {
+            "candidates_tested": 10,
+            "passing": 8,
+            "failing": 2,
+            "candidates": [
+                {"id": f"candidate-{{cycle_id}}-{i:03d}", "tests_passed": 25 if i < 8 else 20,
+                 "tests_failed": 0 if i < 8 else 5, "bandit_issues": 0,
+                 "verifier_pass": i < 8}
+                for i in range(10)
+            ],
         },
-        {
-            "step": 5,
-            "name": "Exploit Replay",
-            "agent": "exploit_agent",
-            "detail": "Replaying 5 payloads against 8 passing candidates...",
-            "duration": 1.2,
-            "result": {
-                "candidates_tested": 8,
-                "exploits_blocked": 6,
-                "candidates": [
-                    {"id": f"candidate-{cycle_id}-{i:03d}",
-                     "exploit_rate": 0.0 if i < 6 else 0.6,
-                     "blocked": i < 6}
-                    for i in range(8)
-                ],
-            },
+    },
+    {
+        "step": 5,
+        "name": "Exploit Replay",
+        "agent": "exploit_agent",
+        "detail": "Replaying 5 payloads against 8 passing candidates...",
+        "duration": 1.2,
+        "result": {
+            "candidates_tested": 8,
+            "exploits_blocked": 6,
+            "candidates": [
+                {"id": f"candidate-{{cycle_id}}-{i:03d}",
+                 "exploit_rate": 0.0 if i < 6 else 0.6,
+                 "blocked": i < 6}
+                for i in range(8)
+            ],
         },
-        {
-            "step": 6,
-            "name": "Risk Assessment",
-            "agent": "risk_agent",
-            "detail": "Scoring candidates: security(0.6) + correctness(0.4) - bandit_penalty...",
-            "duration": 0.3,
-            "result": {
-                "winner": f"candidate-{cycle_id}-000",
-                "winner_confidence": 0.95,
-                "action": "deploy",
-                "ranked": [
-                    {"id": f"candidate-{cycle_id}-{i:03d}",
-                     "confidence": round(0.95 - i * 0.03, 2)}
-                    for i in range(6)
-                ],
-            },
+    },
+    {
+        "step": 6,
+        "name": "Risk Assessment",
+        "agent": "risk_agent",
+        "detail": "Scoring candidates: security(0.6) + correctness(0.4) - bandit_penalty...",
+        "duration": 0.3,
+        "result": {
+            "winner": "candidate-{cycle_id}-000",
+            "winner_confidence": 0.95,
+            "action": "deploy",
+            "ranked": [
+                {"id": f"candidate-{{cycle_id}}-{i:03d}",
+                 "confidence": round(0.95 - i * 0.03, 2)}
+                for i in range(6)
+            ],
         },
-    ]
+    },
+]
+
+
+# Fixed per-cycle telemetry: (metric, value) pairs, and (index, exploit_rate,
+# confidence) for the ranked candidates. cycle_latency_s is measured per cycle.
+_BASE_METRICS = (
+    ("baseline_exploit_rate", 1.0),
+    ("mutation_count", 10),
+    ("mutation_latency_ms", 600),
+    ("candidates_passing_tests", 8),
+    ("candidates_blocking_exploits", 6),
+    ("cycle_action", "deploy"),
+    ("risk_latency_ms", 300),
+    ("candidate_count", 10),
+)
+_CANDIDATE_METRICS = tuple(
+    (i, 0.0 if i < 4 else 0.2, round(0.95 - i * 0.03, 2)) for i in range(6)
+)
+
+
+def _bind_step_result(result: Dict[str, Any], cycle_id: str) -> Dict[str, Any]:
+    """Shallow-copy a step result template with this cycle's candidate ids."""
+    out = dict(result)
+    if "winner" in out:
+        out["winner"] = out["winner"].format(cycle_id=cycle_id)
+    for key in ("candidates", "ranked"):
+        if key in out:
+            out[key] = [{**c, "id": c["id"].format(cycle_id=cycle_id)} for c in out[key]]
+    return out
+
+
+# Kept open across cycles; O_APPEND makes each cycle's single write land at
+# end-of-file without interleaving with other writers. Reopened whenever the
+# path no longer names the open file (deleted or rotated), so writes never go
+# to an unlinked inode.
+_telemetry_write_fd: Optional[int] = None
+
+
+def _telemetry_fd() -> int:
+    global _telemetry_write_fd
+    if _telemetry_write_fd is not None:
+        try:
+            if os.stat(TELEMETRY_FILE).st_ino == os.fstat(_telemetry_write_fd).st_ino:
+                return _telemetry_write_fd
+        except FileNotFoundError:
+            pass
+        os.close(_telemetry_write_fd)
+        _telemetry_write_fd = None
+    _telemetry_write_fd = os.open(
+        str(TELEMETRY_FILE), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+    )
+    return _telemetry_write_fd
+
+
+async def run_simulated_cycle():
+    """Run a simulated defense cycle with realistic timing and broadcast events."""
+    cycle_id = str(uuid.uuid4())[:8]
+    t0 = time.time()
 
     # Broadcast cycle start
-    await broadcast({
+    broadcast({
         "type": "cycle_start",
         "cycle_id": cycle_id,
         "timestamp": t0,
-    })
+    }, topic="steps")
 
-    for step_data in steps:
+    for step_data in _STEP_TEMPLATES:
         # Broadcast step start
-        await broadcast({
+        broadcast({
             "type": "step_start",
             "cycle_id": cycle_id,
             "step": step_data["step"],
             "name": step_data["name"],
             "agent": step_data["agent"],
             "detail": step_data["detail"],
-        })
+        }, topic="steps")
 
         # Simulate processing time
         await asyncio.sleep(step_data["duration"])
 
         # Broadcast step complete
-        await broadcast({
+        broadcast({
             "type": "step_complete",
             "cycle_id": cycle_id,
             "step": step_data["step"],
             "name": step_data["name"],
             "agent": step_data["agent"],
-            "result": step_data["result"],
+            "result": _bind_step_result(step_data["result"], cycle_id),
             "latency_ms": round(step_data["duration"] * 1000),
-        })
+        }, topic="steps")
 
     total_s = round(time.time() - t0, 2)
 
     # Write telemetry
     TELEMETRY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    now = time.time()
     telemetry_events = [
-        {"timestamp": time.time(), "metric": "baseline_exploit_rate", "value": 1.0, "cycle_id": cycle_id},
-        {"timestamp": time.time(), "metric": "mutation_count", "value": 10, "cycle_id": cycle_id},
-        {"timestamp": time.time(), "metric": "mutation_latency_ms", "value": 600, "cycle_id": cycle_id},
-        {"timestamp": time.time(), "metric": "candidates_passing_tests", "value": 8, "cycle_id": cycle_id},
-        {"timestamp": time.time(), "metric": "candidates_blocking_exploits", "value": 6, "cycle_id": cycle_id},
-        {"timestamp": time.time(), "metric": "cycle_latency_s", "value": total_s, "cycle_id": cycle_id},
-        {"timestamp": time.time(), "metric": "cycle_action", "value": "deploy", "cycle_id": cycle_id},
-        {"timestamp": time.time(), "metric": "risk_latency_ms", "value": 300, "cycle_id": cycle_id},
-        {"timestamp": time.time(), "metric": "candidate_count", "value": 10, "cycle_id": cycle_id},
+        {"timestamp": now, "metric": m, "value": v, "cycle_id": cycle_id}
+        for m, v in _BASE_METRICS
+    ]
+    telemetry_events.append(
+        {"timestamp": now, "metric": "cycle_latency_s", "value": total_s, "cycle_id": cycle_id}
+    )
+    telemetry_events += [
+        {"timestamp": now, "metric": m, "value": v, "cycle_id": cycle_id,
+         "candidate_id": f"candidate-{cycle_id}-{i:03d}"}
+        for i, rate, conf in _CANDIDATE_METRICS
+        for m, v in (("candidate_exploit_rate", rate), ("candidate_confidence", conf))
     ]
-    for i in range(6):
-        telemetry_events.append({
-            "timestamp": time.time(),
-            "metric": "candidate_exploit_rate",
-            "value": 0.0 if i < 4 else 0.2,
-            "cycle_id": cycle_id,
-            "candidate_id": f"candidate-{cycle_id}-{i:03d}",
-        })
-        telemetry_events.append({
-            "timestamp": time.time(),
-            "metric": "candidate_confidence",
-            "value": round(0.95 - i * 0.03, 2),
-            "cycle_id": cycle_id,
-            "candidate_id": f"candidate-{cycle_id}-{i:03d}",
-        })
 
-    with open(TELEMETRY_FILE, "a") as f:
-        for ev in telemetry_events:
-            f.write(json.dumps(ev) + "\n")
+    blob = b"".join(json_dumpb(ev) + b"\n" for ev in telemetry_events)
+    os.write(_telemetry_fd(), blob)
+    # Refresh and push before announcing completion, so stats already include
+    # this cycle when cycle_complete (or the /api/defend response) arrives
+    await publish_stats()
 
     # Broadcast cycle complete
-    await broadcast({
+    broadcast({
         "type": "cycle_complete",
         "cycle_id": cycle_id,
         "total_latency_s": total_s,
@@ -341,38 +663,46 @@ def validate_input_v2(val: str) -> bool:
         "winner_confidence": 0.95,
         "exploit_before": 1.0,
         "exploit_after": 0.0,
-    })
+    }, topic="history")
 
     return cycle_id
 
 
 # ── API Routes ───────────────────────────────────────────────────────────────
 
+@app.on_event("startup")
+async def enable_eager_tasks():
+    # Python 3.12+: create_task(run_simulated_cycle()) runs inline up to its
+    # first real suspension, so the cycle_start broadcast goes out immediately.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+
+@app.on_event("startup")
+async def start_stats_refresher():
+    await refresh_stats()
+    _spawn(stats_refresh_loop())
+
+
 @app.get("/api/stats")
 async def api_stats():
-    events = load_telemetry()
-    stats = compute_stats(events)
-    manifest = load_manifest()
-    return JSONResponse({
-        "stats": stats,
-        "manifest": manifest,
-        "telemetry_count": len(events),
-    })
+    return _stats_snapshot
 
 
 @app.post("/api/defend")
 async def api_defend():
     cycle_id = await run_simulated_cycle()
-    # Return fresh stats so the caller can update the UI even without WebSocket
-    events = load_telemetry()
-    stats = compute_stats(events)
-    return JSONResponse({"status": "ok", "cycle_id": cycle_id, "stats": stats})
+    # The cycle refreshed the snapshot, so the caller can update the UI even without WebSocket
+    return {"status": "ok", "cycle_id": cycle_id, "stats": _stats_snapshot["stats"]}
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     await ws.accept()
-    ws_clients.append(ws)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=WS_QUEUE_MAXSIZE)
+    ws_clients[ws] = queue
+    subscribe(ws, WS_TOPICS)
+    pump = asyncio.create_task(_pump(ws, queue))
     logger.info("WebSocket client connected (total: %d)", len(ws_clients))
     try:
         while True:
@@ -382,18 +712,30 @@ async def websocket_endpoint(ws: WebSocket):
             except json.JSONDecodeError:
                 logger.warning("Bad JSON from WebSocket client: %s", data[:100])
                 continue
-            if msg.get("action") == "defend":
+            if msg.get("action") == "subscribe":
+                topics = msg.get("topics")
+                if isinstance(topics, list):
+                    subscribe(ws, topics)
+                else:
+                    # A bare string would otherwise subscribe to its characters
+                    logger.warning("Ignoring subscribe with non-list topics: %r", topics)
+            elif msg.get("action") == "defend":
                 logger.info("Defense cycle triggered via WebSocket")
                 asyncio.create_task(run_simulated_cycle())
             elif msg.get("action") == "ping":
-                await ws.send_json({"type": "pong"})
+                # Through the queue: the pump task is this socket's only sender.
+                # A full queue means the client is already being dropped.
+                try:
+                    queue.put_nowait((PONG, PONG))
+                except asyncio.QueueFull:
+                    pass
     except WebSocketDisconnect:
         pass
     except Exception as e:
         logger.error("WebSocket error: %s", e)
     finally:
-        if ws in ws_clients:
-            ws_clients.remove(ws)
+        pump.cancel()
+        _drop_client(ws)
         logger.info("WebSocket client disconnected (total: %d)", len(ws_clients))
 
 
@@ -602,17 +944,19 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     text-align: center;
     position: relative;
     transition: all 0.4s;
+    will-change: transform, opacity;
+    contain: layout paint;
   }
-  .pipeline-node.active {
+  .pipeline-node[data-state="active"] {
     border-color: var(--accent);
     background: linear-gradient(135deg, #00d4ff11, #00d4ff05);
     box-shadow: 0 0 20px var(--glow);
   }
-  .pipeline-node.complete {
+  .pipeline-node[data-state="complete"] {
     border-color: var(--accent2);
     background: linear-gradient(135deg, #00ff8811, #00ff8805);
   }
-  .pipeline-node.failed {
+  .pipeline-node[data-state="failed"] {
     border-color: var(--danger);
     background: linear-gradient(135deg, #ff475711, #ff475705);
   }
@@ -636,13 +980,15 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     color: var(--accent2);
     margin-top: 4px;
   }
+  /* --lit (0 or 1) is set inline by the script; no class or selector change */
   .pipeline-arrow {
+    --lit: 0;
     flex-shrink: 0;
-    color: var(--border);
+    color: color-mix(in srgb, var(--accent2) calc(var(--lit) * 100%), var(--border));
+    text-shadow: 0 0 calc(var(--lit) * 8px) var(--accent2);
     font-size: 16px;
     transition: color 0.4s;
   }
-  .pipeline-arrow.lit { color: var(--accent2); text-shadow: 0 0 8px var(--accent2); }
 
   /* Log Feed */
   .log-feed {
@@ -651,10 +997,13 @@ DASHBOARD_HTML = """<!DOCTYPE html>
     font-size: 11px;
     line-height: 1.6;
     padding: 4px 0;
+    display: flex;
+    flex-direction: column;
   }
   .log-feed::-webkit-scrollbar { width: 4px; }
   .log-feed::-webkit-scrollbar-thumb { background: var(--border); border-radius: 2px; }
   .log-entry {
+    flex-shrink: 0;
     padding: 2px 0;
     border-bottom: 1px solid #ffffff06;
     animation: fadeIn 0.3s;
@@ -1055,8 +1404,7 @@ DASHBOARD_HTML = """<!DOCTYPE html>
   <div class="panel">
     <div class="panel-title"><span class="icon">&#9733;</span> System Architecture</div>
     <div class="arch-diagram" id="arch-diagram">
-      <svg class="arch-svg" id="arch-svg"></svg>
-      <!-- nodes positioned by JS -->
+      {{ARCH_DIAGRAM}}
     </div>
   </div>
 
@@ -1173,27 +1521,127 @@ let ws = null;
 let cycleRunning = false;
 let cycleHistory = [];
 let lastCandidates = [];
+const utf8 = new TextDecoder();
+let inbox = Promise.resolve();
+let pendingMsgs = [];
+let flushScheduled = false;
+let flushing = false;
+let pendingRanked = null;
+
+async function inflate(buf) {
+  const stream = new Blob([buf]).stream().pipeThrough(new DecompressionStream('deflate'));
+  return new Response(stream).arrayBuffer();
+}
+
+// Minimal MessagePack decoder (decode only; no ext types)
+function unpack(buf) {
+  const view = new DataView(buf.buffer, buf.byteOffset, buf.byteLength);
+  let pos = 0;
+  const num = (size, get) => { const v = view[get](pos); pos += size; return v; };
+  const str = (n) => { const s = utf8.decode(buf.subarray(pos, pos + n)); pos += n; return s; };
+  const bin = (n) => { const b = buf.slice(pos, pos + n); pos += n; return b; };
+  const arr = (n) => { const a = new Array(n); for (let i = 0; i < n; i++) a[i] = read(); return a; };
+  const map = (n) => { const o = {}; for (let i = 0; i < n; i++) { const k = read(); o[k] = read(); } return o; };
+  function read() {
+    const b = buf[pos++];
+    if (b < 0x80) return b;
+    if (b < 0x90) return map(b & 0x0f);
+    if (b < 0xa0) return arr(b & 0x0f);
+    if (b < 0xc0) return str(b & 0x1f);
+    if (b >= 0xe0) return b - 0x100;
+    switch (b) {
+      case 0xc0: return null;
+      case 0xc2: return false;
+      case 0xc3: return true;
+      case 0xc4: return bin(num(1, 'getUint8'));
+      case 0xc5: return bin(num(2, 'getUint16'));
+      case 0xc6: return bin(num(4, 'getUint32'));
+      case 0xca: return num(4, 'getFloat32');
+      case 0xcb: return num(8, 'getFloat64');
+      case 0xcc: return num(1, 'getUint8');
+      case 0xcd: return num(2, 'getUint16');
+      case 0xce: return num(4, 'getUint32');
+      case 0xcf: return Number(num(8, 'getBigUint64'));
+      case 0xd0: return num(1, 'getInt8');
+      case 0xd1: return num(2, 'getInt16');
+      case 0xd2: return num(4, 'getInt32');
+      case 0xd3: return Number(num(8, 'getBigInt64'));
+      case 0xd9: return str(num(1, 'getUint8'));
+      case 0xda: return str(num(2, 'getUint16'));
+      case 0xdb: return str(num(4, 'getUint32'));
+      case 0xdc: return arr(num(2, 'getUint16'));
+      case 0xdd: return arr(num(4, 'getUint32'));
+      case 0xde: return map(num(2, 'getUint16'));
+      case 0xdf: return map(num(4, 'getUint32'));
+    }
+    throw new Error('Unsupported MessagePack type 0x' + b.toString(16));
+  }
+  return read();
+}
+
+// Binary frames are MessagePack, or JSON when the server lacks ormsgpack
+function decodeFrame(bytes) {
+  const first = bytes[0];
+  return first === 0x7b || first === 0x5b ? JSON.parse(utf8.decode(bytes)) : unpack(bytes);
+}
 
 // ── WebSocket ───────────────────────────────────────────────────────────────
 function connectWS() {
   const proto = location.protocol === 'https:' ? 'wss' : 'ws';
   ws = new WebSocket(`${proto}://${location.host}/ws`);
+  ws.binaryType = 'arraybuffer';
   ws.onopen = () => {
+    ws.send(JSON.stringify({action: 'subscribe', topics: ['steps', 'stats', 'history']}));
+    clearTimeout(statsTimer);  // stats are pushed while connected
     document.getElementById('ws-status').className = 'status-dot green';
     document.getElementById('ws-label').textContent = 'Connected';
   };
   ws.onclose = () => {
     document.getElementById('ws-status').className = 'status-dot red';
     document.getElementById('ws-label').textContent = 'Disconnected';
+    scheduleStats();  // fall back to polling until reconnected
     setTimeout(connectWS, 2000);
   };
   ws.onmessage = (e) => {
-    const msg = JSON.parse(e.data);
-    handleMessage(msg);
+    // Binary frames are zlib-compressed when large (leading 0x78 byte).
+    // Inflating is async, so every frame goes through one chain to keep order.
+    const data = e.data;
+    inbox = inbox.then(async () => {
+      if (typeof data === 'string') return queueMessages(JSON.parse(data));
+      let bytes = new Uint8Array(data);
+      if (bytes[0] === 0x78) bytes = new Uint8Array(await inflate(data));
+      queueMessages(decodeFrame(bytes));
+    }).catch((err) => console.error('Bad WebSocket frame', err));
   };
 }
 
 // ── Message handler ─────────────────────────────────────────────────────────
+// Messages (single or server-batched arrays) are applied together once per
+// animation frame, so a burst costs one layout instead of one per message.
+function queueMessages(msg) {
+  if (Array.isArray(msg)) pendingMsgs.push(...msg);
+  else pendingMsgs.push(msg);
+  if (!flushScheduled) {
+    flushScheduled = true;
+    requestAnimationFrame(flushMessages);
+  }
+}
+
+function flushMessages() {
+  const batch = pendingMsgs;
+  pendingMsgs = [];
+  flushScheduled = false;
+  flushing = true;
+  batch.forEach(handleMessage);
+  flushing = false;
+  if (pendingRanked) {
+    drawConfidenceChart(pendingRanked);
+    pendingRanked = null;
+  }
+  const feed = document.getElementById('log-feed');
+  feed.scrollTop = feed.scrollHeight;
+}
+
 function handleMessage(msg) {
   switch(msg.type) {
     case 'cycle_start':
@@ -1225,45 +1673,54 @@ function handleMessage(msg) {
         'success'
       );
       showToast(`Deployed ${msg.winner} with ${(msg.winner_confidence*100).toFixed(0)}% confidence`, 'success');
-      cycleHistory.unshift(msg);
-      renderCycleHistory();
-      refreshStats();
+      addCycleHistory(msg);
+      break;
+
+    case 'stats':
+      renderStats(msg.stats);
       break;
   }
 }
 
 // ── Pipeline visualization ──────────────────────────────────────────────────
+// Element handles looked up once at load; steps are 1-based, pipeNodes 0-based
+let pipeNodes = [];
+let expBadges = [];
+
+function cachePipelineRefs() {
+  const byId = (id) => document.getElementById(id);
+  pipeNodes = [1, 2, 3, 4, 5, 6].map(i => ({
+    node: byId(`pipe-${i}`),
+    lat: byId(`pipe-${i}-lat`),
+    arrow: i < 6 ? byId(`arrow-${i}`) : null,
+  }));
+  expBadges = [0, 1, 2, 3, 4].map(i => byId(`exp-${i}`));
+}
+
 function resetPipeline() {
-  for (let i=1;i<=6;i++) {
-    const node = document.getElementById(`pipe-${i}`);
-    node.className = 'pipeline-node';
-    const lat = document.getElementById(`pipe-${i}-lat`);
-    if (lat) lat.textContent = '';
-    if (i<6) document.getElementById(`arrow-${i}`).className = 'pipeline-arrow';
+  for (const p of pipeNodes) {
+    delete p.node.dataset.state;
+    if (p.lat) p.lat.textContent = '';
+    if (p.arrow) p.arrow.style.setProperty('--lit', 0);
   }
   // Reset exploit badges
-  for (let i=0;i<5;i++) {
-    const el = document.getElementById(`exp-${i}`);
+  for (const el of expBadges) {
     el.textContent = 'TESTING...';
-    el.className = 'badge badge-pass';
+    el.classList.replace('badge-fail', 'badge-pass');
   }
   // Clear candidates
-  document.getElementById('cand-body').innerHTML = '';
+  trimCandRows(0);
 }
 
 function activatePipeNode(step) {
-  const node = document.getElementById(`pipe-${step}`);
-  node.className = 'pipeline-node active';
+  pipeNodes[step - 1].node.dataset.state = 'active';
 }
 
 function completePipeNode(step, latencyMs) {
-  const node = document.getElementById(`pipe-${step}`);
-  node.className = 'pipeline-node complete';
-  const lat = document.getElementById(`pipe-${step}-lat`);
-  if (lat) lat.textContent = latencyMs + 'ms';
-  if (step < 6) {
-    document.getElementById(`arrow-${step}`).className = 'pipeline-arrow lit';
-  }
+  const p = pipeNodes[step - 1];
+  p.node.dataset.state = 'complete';
+  if (p.lat) p.lat.textContent = latencyMs + 'ms';
+  if (p.arrow) p.arrow.style.setProperty('--lit', 1);
 }
 
 // ── Handle step results ─────────────────────────────────────────────────────
@@ -1285,7 +1742,7 @@ function handleStepResult(msg) {
   }
   if (msg.step === 6 && r.ranked) {
     updateCandidatesRisk(r.ranked, r.winner);
-    drawConfidenceChart(r.ranked);
+    pendingRanked = r.ranked;  // drawn once at the end of the batch
   }
   if (msg.step === 1) {
     updateExploitBadges(false);
@@ -1349,110 +1806,216 @@ function escHtml(s) {
   return s.replace(/&/g,'&amp;').replace(/[<]/g,'&lt;').replace(/[>]/g,'&gt;');
 }
 
+// One cached row of cell references per candidate; updates only write
+// textContent / className / style, never re-parse HTML.
+let candRows = [];
+// Transform label is fixed per row index, so it's written once at row creation
+const TRANSFORMS = Object.freeze(['swap_validators','swap_validators','swap_validators',
+  'rename_identifiers','rename_identifiers','route_rotation','route_rotation',
+  'reorder_blocks','split_helpers','swap_validators']);
+
+function makeCandRow(tbody, i) {
+  const tr = document.createElement('tr');
+  const td = () => tr.appendChild(document.createElement('td'));
+  const idCell = td();
+  idCell.style.color = 'var(--accent)';
+  td().textContent = TRANSFORMS[i] ?? 'swap_validators';
+  const testsCell = td();
+  const exploitCell = td();
+  const confCell = td();
+  const bar = confCell.appendChild(document.createElement('div'));
+  bar.className = 'conf-bar';
+  const confFill = bar.appendChild(document.createElement('div'));
+  confFill.className = 'conf-bar-fill';
+  const confLabel = confCell.appendChild(document.createTextNode(''));
+  const badgeCell = td().appendChild(document.createElement('span'));
+  tbody.appendChild(tr);
+  return {tr, idCell, testsCell, exploitCell, confFill, confLabel, badgeCell};
+}
+
+function trimCandRows(n) {
+  while (candRows.length > n) candRows.pop().tr.remove();
+}
+
 function renderCandidates(candidates, phase) {
   const tbody = document.getElementById('cand-body');
-  tbody.innerHTML = '';
   lastCandidates = candidates;
-  const transforms = ['swap_validators','swap_validators','swap_validators',
-    'rename_identifiers','rename_identifiers','route_rotation','route_rotation',
-    'reorder_blocks','split_helpers','swap_validators'];
+  trimCandRows(candidates.length);
+  while (candRows.length < candidates.length) candRows.push(makeCandRow(tbody, candRows.length));
   candidates.forEach((c, i) => {
-    const tr = document.createElement('tr');
+    const row = candRows[i];
     const pass = c.verifier_pass;
-    tr.innerHTML = `
-      <td style="color:var(--accent)">${c.id.split('-').slice(-1)[0]}</td>
-      <td>${transforms[i] || 'swap_validators'}</td>
-      <td>${c.tests_passed}/${c.tests_passed + c.tests_failed}</td>
-      <td>-</td>
-      <td><div class="conf-bar"><div class="conf-bar-fill" style="width:0%;background:var(--text2)"></div></div></td>
-      <td><span class="badge ${pass ? 'badge-pass' : 'badge-fail'}">${pass ? 'PASS' : 'FAIL'}</span></td>
-    `;
-    tbody.appendChild(tr);
+    row.tr.classList.remove('winner');
+    row.idCell.textContent = c.id.slice(c.id.lastIndexOf('-') + 1);
+    row.testsCell.textContent = `${c.tests_passed}/${c.tests_passed + c.tests_failed}`;
+    row.exploitCell.textContent = '-';
+    row.exploitCell.className = '';
+    row.confFill.style.width = '0%';
+    row.confFill.style.background = 'var(--text2)';
+    row.confLabel.data = '';
+    row.badgeCell.className = `badge ${pass ? 'badge-pass' : 'badge-fail'}`;
+    row.badgeCell.textContent = pass ? 'PASS' : 'FAIL';
   });
 }
 
 function updateCandidatesExploit(candidates) {
-  const rows = document.getElementById('cand-body').querySelectorAll('tr');
   candidates.forEach((c, i) => {
-    if (rows[i]) {
-      const cells = rows[i].querySelectorAll('td');
-      const rate = c.exploit_rate;
-      cells[3].innerHTML = `<span class="${rate === 0 ? 'blocked' : 'exploited'}">${(rate*100).toFixed(0)}%</span>`;
-    }
+    const row = candRows[i];
+    if (!row) return;
+    const rate = c.exploit_rate;
+    row.exploitCell.textContent = (rate * 100).toFixed(0) + '%';
+    row.exploitCell.className = rate === 0 ? 'blocked' : 'exploited';
   });
 }
 
 function updateCandidatesRisk(ranked, winnerId) {
-  const rows = document.getElementById('cand-body').querySelectorAll('tr');
   ranked.forEach((r, i) => {
-    if (rows[i]) {
-      const cells = rows[i].querySelectorAll('td');
-      const pct = (r.confidence * 100).toFixed(0);
-      const color = r.confidence >= 0.85 ? 'var(--accent2)' : r.confidence >= 0.5 ? 'var(--warn)' : 'var(--danger)';
-      cells[4].innerHTML = `<div class="conf-bar"><div class="conf-bar-fill" style="width:${pct}%;background:${color}"></div></div> ${pct}%`;
-      if (r.id === winnerId) {
-        rows[i].classList.add('winner');
-        cells[5].innerHTML = '<span class="badge badge-deploy">DEPLOY</span>';
-      }
+    const row = candRows[i];
+    if (!row) return;
+    const pct = (r.confidence * 100).toFixed(0);
+    row.confFill.style.width = pct + '%';
+    row.confFill.style.background = r.confidence >= 0.85 ? 'var(--accent2)' : r.confidence >= 0.5 ? 'var(--warn)' : 'var(--danger)';
+    row.confLabel.data = ` ${pct}%`;
+    if (r.id === winnerId) {
+      row.tr.classList.add('winner');
+      row.badgeCell.className = 'badge badge-deploy';
+      row.badgeCell.textContent = 'DEPLOY';
     }
   });
 }
 
 function updateExploitBadges(blocked) {
-  for (let i=0;i<5;i++) {
-    const el = document.getElementById(`exp-${i}`);
+  for (const el of expBadges) {
     if (blocked) {
       el.textContent = 'BLOCKED';
-      el.className = 'badge badge-pass';
+      el.classList.replace('badge-fail', 'badge-pass');
     } else {
       el.textContent = 'EXPLOITED';
-      el.className = 'badge badge-fail';
+      el.classList.replace('badge-pass', 'badge-fail');
     }
   }
 }
 
 // ── Log feed ────────────────────────────────────────────────────────────────
-function addLog(agent, message, level='info') {
+// Fixed ring of 100 rows built once. A new line overwrites the oldest row and
+// gets the next flex `order`, so rows are never created, moved or removed.
+const LOG_SIZE = 100;
+const logRing = [];
+let logSeq = 0;
+
+function buildLogRing() {
   const feed = document.getElementById('log-feed');
-  const ts = new Date().toLocaleTimeString();
-  const div = document.createElement('div');
-  div.className = `log-entry ${level}`;
-  div.innerHTML = `<span class="ts">${ts}</span> <span class="agent">[${agent}]</span> <span class="msg">${message}</span>`;
-  feed.appendChild(div);
-  feed.scrollTop = feed.scrollHeight;
-  // Keep last 100 entries
-  while (feed.children.length > 100) feed.removeChild(feed.firstChild);
+  for (let i = 0; i < LOG_SIZE; i++) {
+    const row = document.createElement('div');
+    row.className = 'log-entry';
+    row.hidden = true;
+    const span = (cls) => {
+      const el = row.appendChild(document.createElement('span'));
+      el.className = cls;
+      return el;
+    };
+    const tsSpan = span('ts');
+    row.append(' ');
+    const agentSpan = span('agent');
+    row.append(' ');
+    const msgSpan = span('msg');
+    feed.appendChild(row);
+    logRing.push({row, tsSpan, agentSpan, msgSpan});
+  }
+}
+
+function addLog(agent, message, level='info') {
+  if (!logRing.length) buildLogRing();
+  const slot = logRing[logSeq % LOG_SIZE];
+  slot.tsSpan.textContent = new Date().toLocaleTimeString();
+  slot.agentSpan.textContent = `[${agent}]`;
+  slot.msgSpan.textContent = message;
+  slot.row.className = 'log-entry ' + level;
+  slot.row.style.order = logSeq++;
+  slot.row.hidden = false;
+  if (!flushing) {
+    const feed = document.getElementById('log-feed');
+    feed.scrollTop = feed.scrollHeight;
+  }
 }
 
 // ── Cycle history ───────────────────────────────────────────────────────────
+// Newest first, capped at HISTORY_MAX. New cycles are prepended (dropping the
+// oldest row) instead of re-rendering; the list is saved to localStorage at
+// most every 5s so a reload restores it.
+const HISTORY_MAX = 50;
+const HISTORY_KEY = 'zerowall.cycleHistory';
+let historySaveTimer = null;
+
+function cycleEntry(c) {
+  const div = document.createElement('div');
+  div.className = 'cycle-entry';
+  const actionClass = c.action === 'deploy' ? 'action-deploy' : c.action === 'rollback' ? 'action-rollback' : 'action-reject';
+  div.innerHTML = `
+    <span class="action-badge ${actionClass}">${c.action}</span>
+    <span style="color:var(--accent)">${c.cycle_id}</span>
+    <span>${c.total_latency_s}s</span>
+    <span>Winner: <span style="color:var(--accent2)">${c.winner || 'none'}</span></span>
+    <span>${(c.exploit_before*100).toFixed(0)}% &rarr; ${(c.exploit_after*100).toFixed(0)}%</span>
+  `;
+  return div;
+}
+
 function renderCycleHistory() {
   const el = document.getElementById('cycle-history');
   if (cycleHistory.length === 0) return;
-  el.innerHTML = '';
-  cycleHistory.forEach(c => {
-    const div = document.createElement('div');
-    div.className = 'cycle-entry';
-    const actionClass = c.action === 'deploy' ? 'action-deploy' : c.action === 'rollback' ? 'action-rollback' : 'action-reject';
-    div.innerHTML = `
-      <span class="action-badge ${actionClass}">${c.action}</span>
-      <span style="color:var(--accent)">${c.cycle_id}</span>
-      <span>${c.total_latency_s}s</span>
-      <span>Winner: <span style="color:var(--accent2)">${c.winner || 'none'}</span></span>
-      <span>${(c.exploit_before*100).toFixed(0)}% &rarr; ${(c.exploit_after*100).toFixed(0)}%</span>
-    `;
-    el.appendChild(div);
-  });
+  // Build off-document, then swap in with a single mutation
+  const frag = document.createDocumentFragment();
+  cycleHistory.forEach(c => frag.appendChild(cycleEntry(c)));
+  el.replaceChildren(frag);
+}
+
+function addCycleHistory(c) {
+  const el = document.getElementById('cycle-history');
+  cycleHistory.unshift(c);
+  if (cycleHistory.length === 1) el.replaceChildren();  // drop the placeholder
+  if (cycleHistory.length > HISTORY_MAX) cycleHistory.length = HISTORY_MAX;
+  el.prepend(cycleEntry(c));
+  while (el.children.length > HISTORY_MAX) el.lastElementChild.remove();
+  saveCycleHistory();
+}
+
+function saveCycleHistory() {
+  if (historySaveTimer) return;
+  historySaveTimer = setTimeout(() => {
+    historySaveTimer = null;
+    try { localStorage.setItem(HISTORY_KEY, JSON.stringify(cycleHistory)); } catch (e) {}
+  }, 5000);
+}
+
+function loadCycleHistory() {
+  try {
+    const saved = JSON.parse(localStorage.getItem(HISTORY_KEY));
+    if (Array.isArray(saved)) cycleHistory = saved.slice(0, HISTORY_MAX);
+  } catch (e) {}
+  renderCycleHistory();
 }
 
 // ── Confidence chart ────────────────────────────────────────────────────────
+const CONF_COLORS = ['#00ff88', '#ffa502', '#ff4757'];
+let lastRankedHash = '';
+
 function drawConfidenceChart(ranked) {
   const canvas = document.getElementById('chart-confidence');
-  const ctx = canvas.getContext('2d');
-  canvas.width = canvas.offsetWidth * 2;
-  canvas.height = 200;
-  ctx.scale(2, 2);
   const w = canvas.offsetWidth;
   const h = 100;
+  // Size is part of the key: a resize clears the canvas even if the data is unchanged
+  const hash = w + 'x' + h + '|' + ranked.map(r => r.id + r.confidence.toFixed(3)).join('|');
+  if (hash === lastRankedHash) return;
+  lastRankedHash = hash;
+
+  const ctx = canvas.getContext('2d');
+  // Resizing the backing store reallocates it, so only do it when the width changes
+  if (canvas.width !== w * 2) {
+    canvas.width = w * 2;
+    canvas.height = 200;
+  }
+  ctx.setTransform(2, 0, 0, 2, 0, 0);
   ctx.clearRect(0, 0, w, h);
 
   // Threshold line
@@ -1466,94 +2029,34 @@ function drawConfidenceChart(ranked) {
   ctx.stroke();
   ctx.setLineDash([]);
 
-  // Bars
+  // Bars: one path per color bucket, then one fill + one stroke each
   const barW = Math.min(40, (w - 20) / ranked.length - 4);
+  const buckets = CONF_COLORS.map(() => new Path2D());
   ranked.forEach((r, i) => {
     const x = 10 + i * (barW + 4);
     const barH = r.confidence * h * 0.9;
-    const y = h - barH - 5;
-    const color = r.confidence >= 0.85 ? '#00ff88' : r.confidence >= 0.5 ? '#ffa502' : '#ff4757';
-    ctx.fillStyle = color + '88';
-    ctx.fillRect(x, y, barW, barH);
-    ctx.strokeStyle = color;
-    ctx.lineWidth = 1;
-    ctx.strokeRect(x, y, barW, barH);
-    // Label
-    ctx.fillStyle = '#8892a4';
-    ctx.font = '8px monospace';
-    ctx.textAlign = 'center';
-    ctx.fillText(`#${i}`, x + barW/2, h - 0);
+    const bucket = r.confidence >= 0.85 ? 0 : r.confidence >= 0.5 ? 1 : 2;
+    buckets[bucket].rect(x, h - barH - 5, barW, barH);
   });
+  buckets.forEach((path, k) => {
+    ctx.fillStyle = CONF_COLORS[k] + '88';
+    ctx.fill(path);
+    ctx.strokeStyle = CONF_COLORS[k];
+    ctx.stroke(path);
+  });
+
+  // Labels
+  ctx.fillStyle = '#8892a4';
+  ctx.font = '8px monospace';
+  ctx.textAlign = 'center';
+  ranked.forEach((r, i) => ctx.fillText(`#${i}`, 10 + i * (barW + 4) + barW/2, h));
 
   // Threshold label
   ctx.fillStyle = '#ff4757aa';
-  ctx.font = '8px monospace';
   ctx.textAlign = 'left';
   ctx.fillText('85% threshold', 4, threshY - 3);
 }
 
-// ── Architecture diagram ────────────────────────────────────────────────────
-function buildArchDiagram() {
-  const container = document.getElementById('arch-diagram');
-  const nodes = [
-    { id:'target', label:'Target App', sub:'FastAPI :8000', x:20, y:20, w:110, h:44 },
-    { id:'orchestrator', label:'Defense Loop', sub:'Orchestrator', x:180, y:20, w:110, h:44 },
-    { id:'mutation', label:'Mutation Agent', sub:'+ Triton planner', x:340, y:8, w:120, h:44, gpu:true },
-    { id:'verifier', label:'Verifier Agent', sub:'pytest + bandit', x:340, y:64, w:120, h:44 },
-    { id:'exploit', label:'Exploit Agent', sub:'payload replay', x:340, y:120, w:120, h:44 },
-    { id:'risk', label:'Risk Agent', sub:'+ Triton scorer', x:340, y:176, w:120, h:44, gpu:true },
-    { id:'explain', label:'Explanation', sub:'+ vLLM', x:340, y:232, w:120, h:44, gpu:true },
-    { id:'transforms', label:'Transforms', sub:'libcst AST', x:180, y:90, w:110, h:44 },
-    { id:'triton', label:'Triton Server', sub:'GPU :8080', x:520, y:40, w:110, h:44, gpu:true },
-    { id:'vllm', label:'vLLM', sub:'GPU :8088', x:520, y:110, w:110, h:44, gpu:true },
-    { id:'telemetry', label:'Telemetry', sub:'JSONL + RAPIDS', x:520, y:190, w:110, h:44, gpu:true },
-    { id:'deploy', label:'Deploy Ctrl', sub:'Blue/Green', x:180, y:175, w:110, h:44 },
-  ];
-
-  const connections = [
-    ['target','orchestrator'],
-    ['orchestrator','mutation'],
-    ['orchestrator','transforms'],
-    ['orchestrator','verifier'],
-    ['orchestrator','exploit'],
-    ['orchestrator','risk'],
-    ['orchestrator','explain'],
-    ['orchestrator','deploy'],
-    ['mutation','triton'],
-    ['risk','triton'],
-    ['explain','vllm'],
-    ['orchestrator','telemetry'],
-    ['deploy','target'],
-  ];
-
-  // Add nodes
-  nodes.forEach(n => {
-    const div = document.createElement('div');
-    div.className = `arch-node ${n.gpu ? 'gpu' : ''}`;
-    div.id = `arch-${n.id}`;
-    div.style.left = n.x + 'px';
-    div.style.top = n.y + 'px';
-    div.style.width = n.w + 'px';
-    div.innerHTML = `<div class="arch-label">${n.label}</div><div class="arch-sub">${n.sub}</div>`;
-    container.appendChild(div);
-  });
-
-  // Draw lines
-  const svg = document.getElementById('arch-svg');
-  connections.forEach(([from, to]) => {
-    const a = nodes.find(n => n.id === from);
-    const b = nodes.find(n => n.id === to);
-    if (!a || !b) return;
-    const line = document.createElementNS('http://www.w3.org/2000/svg', 'line');
-    line.setAttribute('x1', a.x + a.w/2);
-    line.setAttribute('y1', a.y + a.h/2);
-    line.setAttribute('x2', b.x + b.w/2);
-    line.setAttribute('y2', b.y + b.h/2);
-    line.id = `line-${from}-${to}`;
-    svg.appendChild(line);
-  });
-}
-
 // ── Trigger defense ─────────────────────────────────────────────────────────
 function triggerDefend() {
   if (cycleRunning) return;
@@ -1573,22 +2076,14 @@ function triggerDefend() {
         // No WebSocket — manually update UI from HTTP response
         addLog('system', `Cycle ${data.cycle_id} completed`, 'success');
         showToast('Deployed successfully — ' + data.cycle_id, 'success');
-        if (data.stats) {
-          document.getElementById('m-cycles').textContent = data.stats.total_cycles;
-          document.getElementById('m-before').textContent = (data.stats.exploit_before * 100).toFixed(0) + '%';
-          document.getElementById('m-after').textContent = (data.stats.exploit_after * 100).toFixed(0) + '%';
-          document.getElementById('m-latency').textContent = data.stats.avg_cycle_s + 's';
-          document.getElementById('m-candidates').textContent = data.stats.total_candidates;
-        }
+        if (data.stats) renderStats(data.stats);
         // Mark all pipeline nodes complete
-        for (let i=1;i<=6;i++) {
-          const node = document.getElementById('pipe-' + i);
-          node.className = 'pipeline-node complete';
-          if (i<6) document.getElementById('arrow-' + i).className = 'pipeline-arrow lit';
+        for (const p of pipeNodes) {
+          p.node.dataset.state = 'complete';
+          if (p.arrow) p.arrow.style.setProperty('--lit', 1);
         }
         updateExploitBadges(true);
       }
-      refreshStats();
     })
     .catch(err => {
       addLog('system', 'Defense cycle failed: ' + err, 'error');
@@ -1601,19 +2096,59 @@ function triggerDefend() {
 }
 
 // ── Refresh stats from API ──────────────────────────────────────────────────
+// While the WebSocket is open the server pushes stats on the "stats" topic;
+// otherwise this polls every 5s while the tab is visible. A request stuck for
+// 2s is aborted.
+const STATS_POLL_MS = 5000;
+const STAT_FIELDS = [
+  ['m-cycles', 'total_cycles', v => v],
+  ['m-before', 'exploit_before', v => (v * 100).toFixed(0) + '%'],
+  ['m-after', 'exploit_after', v => (v * 100).toFixed(0) + '%'],
+  ['m-latency', 'avg_cycle_s', v => v + 's'],
+  ['m-candidates', 'total_candidates', v => v],
+];
+const lastStats = {};
+let statsTimer = null;
+let statsRequest = null;
+
+function renderStats(s) {
+  for (const [id, key, fmt] of STAT_FIELDS) {
+    if (s[key] === lastStats[key]) continue;
+    lastStats[key] = s[key];
+    document.getElementById(id).textContent = fmt(s[key]);
+  }
+}
+
+function scheduleStats() {
+  clearTimeout(statsTimer);
+  const live = ws && ws.readyState === WebSocket.OPEN;
+  statsTimer = document.hidden || live ? null : setTimeout(refreshStats, STATS_POLL_MS);
+}
+
 async function refreshStats() {
+  clearTimeout(statsTimer);
+  if (statsRequest) statsRequest.abort();
+  const ctl = statsRequest = new AbortController();
+  const timeout = setTimeout(() => ctl.abort(), 2000);
   try {
-    const resp = await fetch('/api/stats');
+    const resp = await fetch('/api/stats', {cache: 'no-store', signal: ctl.signal});
     const data = await resp.json();
-    const s = data.stats;
-    document.getElementById('m-cycles').textContent = s.total_cycles;
-    document.getElementById('m-before').textContent = (s.exploit_before * 100).toFixed(0) + '%';
-    document.getElementById('m-after').textContent = (s.exploit_after * 100).toFixed(0) + '%';
-    document.getElementById('m-latency').textContent = s.avg_cycle_s + 's';
-    document.getElementById('m-candidates').textContent = s.total_candidates;
-  } catch(e) {}
+    renderStats(data.stats);
+  } catch(e) {
+  } finally {
+    clearTimeout(timeout);
+    if (statsRequest === ctl) {
+      statsRequest = null;
+      scheduleStats();
+    }
+  }
 }
 
+document.addEventListener('visibilitychange', () => {
+  if (document.hidden) clearTimeout(statsTimer);
+  else refreshStats();
+});
+
 // ── Toast ───────────────────────────────────────────────────────────────────
 function showToast(msg, type='info') {
   const container = document.getElementById('toasts');
@@ -1631,12 +2166,13 @@ function updateClock() {
 
 // ── Init ────────────────────────────────────────────────────────────────────
 window.addEventListener('load', () => {
-  buildArchDiagram();
+  buildLogRing();
+  cachePipelineRefs();
+  loadCycleHistory();
   connectWS();
   refreshStats();
   updateClock();
   setInterval(updateClock, 1000);
-  setInterval(refreshStats, 5000);
   addLog('system', 'ZeroWall Visual Dashboard initialized', 'success');
   addLog('system', 'WebSocket connecting to backend...', 'info');
 });
@@ -1646,9 +2182,77 @@ window.addEventListener('load', () => {
 """
 
 
+# ── Architecture diagram (rendered into the page once, at import) ───────────
+
+# (id, label, sub, x, y, w, h, gpu)
+ARCH_NODES = (
+    ("target", "Target App", "FastAPI :8000", 20, 20, 110, 44, False),
+    ("orchestrator", "Defense Loop", "Orchestrator", 180, 20, 110, 44, False),
+    ("mutation", "Mutation Agent", "+ Triton planner", 340, 8, 120, 44, True),
+    ("verifier", "Verifier Agent", "pytest + bandit", 340, 64, 120, 44, False),
+    ("exploit", "Exploit Agent", "payload replay", 340, 120, 120, 44, False),
+    ("risk", "Risk Agent", "+ Triton scorer", 340, 176, 120, 44, True),
+    ("explain", "Explanation", "+ vLLM", 340, 232, 120, 44, True),
+    ("transforms", "Transforms", "libcst AST", 180, 90, 110, 44, False),
+    ("triton", "Triton Server", "GPU :8080", 520, 40, 110, 44, True),
+    ("vllm", "vLLM", "GPU :8088", 520, 110, 110, 44, True),
+    ("telemetry", "Telemetry", "JSONL + RAPIDS", 520, 190, 110, 44, True),
+    ("deploy", "Deploy Ctrl", "Blue/Green", 180, 175, 110, 44, False),
+)
+
+ARCH_CONNECTIONS = (
+    ("target", "orchestrator"),
+    ("orchestrator", "mutation"),
+    ("orchestrator", "transforms"),
+    ("orchestrator", "verifier"),
+    ("orchestrator", "exploit"),
+    ("orchestrator", "risk"),
+    ("orchestrator", "explain"),
+    ("orchestrator", "deploy"),
+    ("mutation", "triton"),
+    ("risk", "triton"),
+    ("explain", "vllm"),
+    ("orchestrator", "telemetry"),
+    ("deploy", "target"),
+)
+
+
+def _render_arch_diagram() -> str:
+    centers = {n[0]: (n[3] + n[5] / 2, n[4] + n[6] / 2) for n in ARCH_NODES}
+    lines = "".join(
+        f'<line x1="{centers[a][0]:g}" y1="{centers[a][1]:g}" '
+        f'x2="{centers[b][0]:g}" y2="{centers[b][1]:g}" id="line-{a}-{b}"/>'
+        for a, b in ARCH_CONNECTIONS
+    )
+    nodes = "".join(
+        f'<div class="arch-node{" gpu" if gpu else ""}" id="arch-{node_id}" '
+        f'style="left:{x}px;top:{y}px;width:{w}px">'
+        f'<div class="arch-label">{label}</div><div class="arch-sub">{sub}</div></div>'
+        for node_id, label, sub, x, y, w, _h, gpu in ARCH_NODES
+    )
+    return f'<svg class="arch-svg" id="arch-svg">{lines}</svg>{nodes}'
+
+
+# The page never changes at runtime: fill in the diagram, then keep only the
+# UTF-8 bytes (plus a gzip copy and fingerprint) so serving never encodes
+DASHBOARD_HTML = DASHBOARD_HTML.replace("{{ARCH_DIAGRAM}}", _render_arch_diagram()).encode("utf-8")
+DASHBOARD_HTML_GZ = gzip.compress(DASHBOARD_HTML, compresslevel=9)
+DASHBOARD_ETAG = '"%s"' % hashlib.blake2b(DASHBOARD_HTML, digest_size=16).hexdigest()
+
+
 @app.get("/", response_class=HTMLResponse)
-async def index():
-    return HTMLResponse(content=DASHBOARD_HTML)
+async def index(request: Request):
+    headers = {
+        "ETag": DASHBOARD_ETAG,
+        "Cache-Control": "public, max-age=60",
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == DASHBOARD_ETAG:
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(DASHBOARD_HTML_GZ, media_type="text/html", headers=headers)
+    return Response(DASHBOARD_HTML, media_type="text/html", headers=headers)
 
 
 # ── Main ─────────────────────────────────────────────────────────────────────
@@ -1663,5 +2267,10 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8888,
         reload=False,
-        log_level="info",
+        loop=EVENT_LOOP,
+        http=HTTP_IMPL,
+        log_level="warning",
+        access_log=False,
+        ws_ping_interval=20,
+        ws_ping_timeout=20,
     )
@@ -3,7 +3,17 @@
 ZeroWall Demo UI — tmux panel renderer.
 Usage: python demo_ui.py --panel [status|attacks|defense|telemetry]
 """
-import sys, time, random, math, argparse, datetime
+import sys, time, random, math, argparse, datetime, re, shutil
+from bisect import bisect_right
+
+import numpy as np
+
+# numba is optional: without it the sparkline kernel just runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return args[0] if args and callable(args[0]) else (lambda fn: fn)
 
 # ANSI colors
 R  = "\033[31m"
@@ -25,8 +35,44 @@ BLD= "\033[1m"
 RST= "\033[0m"
 REV= "\033[7m"
 
-def clr(): print("\033[2J\033[H", end="")
+CLEAR = "\033[2J\033[H"
+PANEL_W = 74
 def ts(): return datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
+def rule(color): return f"{color}{'─'*PANEL_W}{RST}"
+
+def show(lines):
+    """Emit a whole frame (clear + lines) with one write."""
+    sys.stdout.write(CLEAR + "\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+class RngPool:
+    """Hands out numpy samples drawn in bulk, refilling when a buffer runs out."""
+    def __init__(self, size=4096):
+        self.rng = np.random.default_rng()
+        self.size = size
+        self.floats, self.fi = [], 0
+        self.normals, self.ni = [], 0
+
+    def random(self):
+        if self.fi >= len(self.floats):
+            self.floats, self.fi = self.rng.random(self.size, dtype=np.float32).tolist(), 0
+        self.fi += 1
+        return self.floats[self.fi - 1]
+
+    def gauss(self, mu, sigma):
+        if self.ni >= len(self.normals):
+            self.normals, self.ni = self.rng.standard_normal(self.size, dtype=np.float32).tolist(), 0
+        self.ni += 1
+        return mu + sigma * self.normals[self.ni - 1]
+
+    def randint(self, a, b):
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def weighted(self, options, cum_weights):
+        return options[bisect_right(cum_weights, self.random() * cum_weights[-1])]
 
 # ─────────────────────────────────────────────
 # PANEL 1 — STATUS
@@ -39,47 +85,49 @@ SERVICES = [
     ("streamlit",       8501, "Streamlit Dashboard"),
 ]
 
+SERVICE_ROWS = [(f" {BW}{name:<22}{RST} :{port}  [", f"ms{RST}  {BLD}{desc}{RST}") for name, port, desc in SERVICES]
+STATUS_BARS = [f"{BG}{'█'*n}{DIM}{'░'*(20-n)}{RST}" for n in range(21)]
+DOT_OK, DOT_DEGRADED = f"{BG}●{RST}", f"{Y}◉{RST}"
+STATUS_TOP = rule(BLD + BC)
+STATUS_TITLE = f"{BLD}{BC} ⬡  ZEROWALL  —  SERVICE STATUS MONITOR{RST}{'':>30}{DIM}"
+STATUS_MID = rule(DIM)
+
 def panel_status():
     frame = 0
     while True:
-        clr()
-        w = 74
-        print(f"{BLD}{BC}{'─'*w}{RST}")
-        print(f"{BLD}{BC} ⬡  ZEROWALL  —  SERVICE STATUS MONITOR{RST}{'':>30}{DIM}{ts()}{RST}")
-        print(f"{BLD}{BC}{'─'*w}{RST}")
-        print()
-
-        for name, port, desc in SERVICES:
+        out = [STATUS_TOP, f"{STATUS_TITLE}{ts()}{RST}", STATUS_TOP, ""]
+
+        for prefix, suffix in SERVICE_ROWS:
             # Simulate all healthy after initial startup
-            jitter = random.random()
-            if jitter < 0.04:
-                status, dot, latency = "DEGRADED", f"{Y}◉{RST}", random.randint(400, 900)
+            if random.random() < 0.04:
+                dot, latency = DOT_DEGRADED, random.randint(400, 900)
             else:
-                status, dot, latency = "HEALTHY ", f"{BG}●{RST}", random.randint(1, 45)
+                dot, latency = DOT_OK, random.randint(1, 45)
+            bar = STATUS_BARS[int((1 - latency/1000) * 20)]
+            out.append(f"  {dot}{prefix}{bar}] {DIM}{latency:>4}{suffix}")
+            out.append("")
 
-            bar_fill = int((1 - latency/1000) * 20)
-            bar = f"{BG}{'█'*bar_fill}{DIM}{'░'*(20-bar_fill)}{RST}"
-            print(f"  {dot} {BW}{name:<22}{RST} :{port}  [{bar}] {DIM}{latency:>4}ms{RST}  {BLD}{desc}{RST}")
-            print()
-
-        print(f"{DIM}{'─'*w}{RST}")
+        out.append(STATUS_MID)
 
         # Defense cycle counter
         cycles = frame // 8
         mutations = cycles * random.randint(3, 7) if cycles else 0
         blocked   = int(mutations * 0.97)
-        print()
-        print(f"  {BLD}Defense Cycles Completed:{RST}  {BG}{cycles:>6}{RST}")
-        print(f"  {BLD}Mutations Deployed:      {RST}  {BC}{mutations:>6}{RST}")
-        print(f"  {BLD}Exploits Blocked:        {RST}  {BG}{blocked:>6}{RST}  {DIM}(97.3% block rate){RST}")
-        print(f"  {BLD}Active MTD Strategy:     {RST}  {BY}ADAPTIVE-AI v2.1{RST}")
-        print()
+        out += [
+            "",
+            f"  {BLD}Defense Cycles Completed:{RST}  {BG}{cycles:>6}{RST}",
+            f"  {BLD}Mutations Deployed:      {RST}  {BC}{mutations:>6}{RST}",
+            f"  {BLD}Exploits Blocked:        {RST}  {BG}{blocked:>6}{RST}  {DIM}(97.3% block rate){RST}",
+            f"  {BLD}Active MTD Strategy:     {RST}  {BY}ADAPTIVE-AI v2.1{RST}",
+            "",
+        ]
 
         uptime_s = frame * 2
         h, rem = divmod(uptime_s, 3600)
         m, s   = divmod(rem, 60)
-        print(f"  {DIM}Uptime: {h:02d}:{m:02d}:{s:02d}   Branch: fix/dgx-spark-setup   GPU: DGX Spark{RST}")
-        print(f"{BLD}{BC}{'─'*w}{RST}")
+        out.append(f"  {DIM}Uptime: {h:02d}:{m:02d}:{s:02d}   Branch: fix/dgx-spark-setup   GPU: DGX Spark{RST}")
+        out.append(STATUS_TOP)
+        show(out)
 
         frame += 1
         time.sleep(2)
@@ -99,45 +147,59 @@ ATTACK_TYPES = [
 
 ENDPOINTS = ["/api/users", "/api/exec", "/api/query", "/login", "/admin", "/api/data", "/search"]
 IPS = [f"10.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}" for _ in range(30)]
+OUTCOMES = [("BLOCKED", BG), ("MUTATED", BY), ("ALLOWED", BR)]
+OUTCOME_CUM = [70, 95, 100]
+BURST_CUM = [1, 5, 8, 9]  # 0-3 attacks per tick, weights 1/4/3/1
+
+# Fully colored two-line row per (kind, outcome); only ts/ip/endpoint/payload vary
+ROW_TMPL = {
+    (kind, outcome): (
+        f"  {DIM}%s{RST}  {color}{BLD}{kind:<10}{RST}  {DIM}%-17s{RST}  {W}%-14s{RST}  {oc}{BLD}{outcome:<8}{RST}\n"
+        f"  {DIM}{'':>12}  payload: %s{RST}"
+    )
+    for kind, color, _ in ATTACK_TYPES
+    for outcome, oc in OUTCOMES
+}
+
+ATTACKS_TOP = rule(BLD + BR)
+ATTACKS_TITLE = f"{BLD}{BR} ⚠  LIVE ATTACK FEED  —  IDS / WAF INTERCEPT{RST}{'':>20}{DIM}"
+ATTACKS_MID = rule(DIM)
 
 def panel_attacks():
+    rng = RngPool()
     log = []
     frame = 0
     while True:
-        clr()
-        w = 74
-        print(f"{BLD}{BR}{'─'*w}{RST}")
-        print(f"{BLD}{BR} ⚠  LIVE ATTACK FEED  —  IDS / WAF INTERCEPT{RST}{'':>20}{DIM}{ts()}{RST}")
-        print(f"{BLD}{BR}{'─'*w}{RST}")
+        out = [ATTACKS_TOP, f"{ATTACKS_TITLE}{ts()}{RST}", ATTACKS_TOP]
 
         # Generate 0-3 new attacks per tick
-        count = random.choices([0,1,2,3], weights=[1,4,3,1])[0]
+        count = bisect_right(BURST_CUM, rng.random() * BURST_CUM[-1])
         for _ in range(count):
-            kind, color, payloads = random.choice(ATTACK_TYPES)
-            payload = random.choice(payloads)
-            endpoint = random.choice(ENDPOINTS)
-            ip = random.choice(IPS)
-            outcome = random.choices(["BLOCKED", "MUTATED", "ALLOWED"], weights=[70, 25, 5])[0]
-            out_color = BG if outcome == "BLOCKED" else (BY if outcome == "MUTATED" else BR)
-            log.append((ts(), ip, kind, color, endpoint, payload[:28], outcome, out_color))
+            kind, _, payloads = rng.choice(ATTACK_TYPES)
+            payload = rng.choice(payloads)
+            endpoint = rng.choice(ENDPOINTS)
+            ip = rng.choice(IPS)
+            outcome, _ = rng.weighted(OUTCOMES, OUTCOME_CUM)
+            # Rows never change once logged, so render them once here
+            log.append(ROW_TMPL[(kind, outcome)] % (ts(), ip, endpoint, payload[:28]))
 
         # Keep last 14 entries
         log = log[-14:]
 
-        print()
+        out.append("")
         if not log:
-            print(f"  {DIM}Monitoring... no attacks yet.{RST}")
-        for entry in log:
-            t, ip, kind, color, ep, pay, outcome, oc = entry
-            print(f"  {DIM}{t}{RST}  {color}{BLD}{kind:<10}{RST}  {DIM}{ip:<17}{RST}  {W}{ep:<14}{RST}  {oc}{BLD}{outcome:<8}{RST}")
-            print(f"  {DIM}{'':>12}  payload: {pay}{RST}")
+            out.append(f"  {DIM}Monitoring... no attacks yet.{RST}")
+        out += log
 
         total = len(log) * (frame + 1) // max(frame + 1, 1) + frame * 3
         blocked_count = int(total * 0.96)
-        print()
-        print(f"{DIM}{'─'*w}{RST}")
-        print(f"  {DIM}Total intercepted this session: {BW}{frame*3 + len(log)}{RST}{DIM}  |  Blocked: {BG}{blocked_count}{RST}{DIM}  |  Feed rate: ~{random.randint(2,12)}/s{RST}")
-        print(f"{BLD}{BR}{'─'*w}{RST}")
+        out += [
+            "",
+            ATTACKS_MID,
+            f"  {DIM}Total intercepted this session: {BW}{frame*3 + len(log)}{RST}{DIM}  |  Blocked: {BG}{blocked_count}{RST}{DIM}  |  Feed rate: ~{rng.randint(2,12)}/s{RST}",
+            ATTACKS_TOP,
+        ]
+        show(out)
 
         frame += 1
         time.sleep(1.5)
@@ -159,149 +221,190 @@ PHASES = [
 
 def spinner(i): return "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"[i % 10]
 
+DEFENSE_TOP = rule(BLD + BM)
+DEFENSE_TITLE = f"{BLD}{BM} ⬡  AI DEFENSE CYCLE  —  MTD ORCHESTRATOR{RST}{'':>21}{DIM}"
+DEFENSE_MID = rule(DIM)
+# Per-phase row text for each state; only the active spinner glyph varies per tick
+PHASE_DONE    = [f"  {BG}✓{RST} {BG}DONE{RST}     {BLD}{name:<26}{RST}  {DIM}{detail}{RST}" for name, _, detail in PHASES]
+PHASE_WAITING = [f"  {DIM}○{RST} {DIM}WAITING{RST}  {BLD}{name:<26}{RST}" for name, _, _ in PHASES]
+PHASE_ACTIVE  = [(f"  {color}", f"{RST} {color}{BLD}ACTIVE {RST}  {BLD}{name:<26}{RST}  {DIM}{detail}{RST}") for name, color, detail in PHASES]
+PHASE_SUMMARY = [f"  {BG}✓{RST} {BG}DONE{RST}    {BLD}{name:<26}{RST}  {DIM}{detail}{RST}" for name, _, detail in PHASES]
+
+# Terminal rows (1-based) in a full defense frame, for in-place patches
+PHASE_ROW0 = 7
+PROGRESS_ROW = PHASE_ROW0 + 2 * len(PHASES) + 1
+DEFENSE_ROWS = PROGRESS_ROW + 1
+
+_SGR = re.compile(r"(\033\[[0-9;]*m)")
+
+def clip(text, cols):
+    """Cut a row to `cols` visible columns (SGR escapes take none) so it never wraps."""
+    out, left = [], cols
+    for i, part in enumerate(_SGR.split(text)):
+        if i % 2:
+            out.append(part)
+        elif len(part) > left:
+            out.append(part[:left])
+            return "".join(out) + RST
+        else:
+            out.append(part)
+            left -= len(part)
+    return text
+
+def at(row, text, cols): return f"\033[{row};1H\033[2K{clip(text, cols)}"
+
+def defense_frame(cycle, phase_idx, active, progress):
+    out = [DEFENSE_TOP, f"{DEFENSE_TITLE}{ts()}{RST}", DEFENSE_TOP, "",
+           f"  {DIM}Defense Cycle #{cycle + 1:04d}    Model: vLLM phi-2    Strategy: ADAPTIVE-AI v2.1{RST}", ""]
+    for i in range(len(PHASES)):
+        out += [PHASE_DONE[i] if i < phase_idx else active if i == phase_idx else PHASE_WAITING[i], ""]
+    return out + [DEFENSE_MID, progress, DEFENSE_TOP]
+
 def panel_defense():
     cycle = 0
+    n = len(PHASES)
+    drawn_size = None  # pane size the last full frame was laid out for
     while True:
-        for phase_idx in range(len(PHASES)):
+        for phase_idx in range(n):
             for sub in range(6):  # animate each phase
-                clr()
-                w = 74
-                print(f"{BLD}{BM}{'─'*w}{RST}")
-                print(f"{BLD}{BM} ⬡  AI DEFENSE CYCLE  —  MTD ORCHESTRATOR{RST}{'':>21}{DIM}{ts()}{RST}")
-                print(f"{BLD}{BM}{'─'*w}{RST}")
-                print()
-                print(f"  {DIM}Defense Cycle #{cycle + 1:04d}    Model: vLLM phi-2    Strategy: ADAPTIVE-AI v2.1{RST}")
-                print()
-
-                for i, (name, color, detail) in enumerate(PHASES):
-                    if i < phase_idx:
-                        icon = f"{BG}✓{RST}"
-                        state = f"{BG}DONE{RST}   "
-                    elif i == phase_idx:
-                        icon = f"{color}{spinner(sub)}{RST}"
-                        state = f"{color}{BLD}ACTIVE {RST}"
-                    else:
-                        icon = f"{DIM}○{RST}"
-                        state = f"{DIM}WAITING{RST}"
-
-                    print(f"  {icon} {state}  {BLD}{name:<26}{RST}", end="")
-                    if i <= phase_idx:
-                        print(f"  {DIM}{detail}{RST}")
-                    else:
-                        print()
-                    print()
-
-                # Progress bar
-                pct = int(((phase_idx + sub/6) / len(PHASES)) * 100)
+                pct = int(((phase_idx + sub/6) / n) * 100)
                 filled = pct // 2
-                bar = f"{BG}{'█'*filled}{DIM}{'░'*(50-filled)}{RST}"
-                print(f"{DIM}{'─'*w}{RST}")
-                print(f"  Progress  [{bar}] {BY}{pct:>3}%{RST}")
-                print(f"{BLD}{BM}{'─'*w}{RST}")
+                progress = f"  Progress  [{BG}{'█'*filled}{DIM}{'░'*(50-filled)}{RST}] {BY}{pct:>3}%{RST}"
+                head, tail = PHASE_ACTIVE[phase_idx]
+                active = f"{head}{spinner(sub)}{tail}"
+
+                size = shutil.get_terminal_size()
+                cols = size.columns
+                # Row addressing only holds while the frame fits the pane unscrolled
+                # (plus the trailing newline) at the size it was drawn for
+                if (phase_idx == 0 and sub == 0) or size != drawn_size or size.lines <= DEFENSE_ROWS:
+                    # Full frame once per cycle, or every tick in a short pane ...
+                    show([clip(row, cols) for row in defense_frame(cycle, phase_idx, active, progress)])
+                    drawn_size = size
+                else:
+                    # ... then only rewrite the clock, the rows whose state moved, and the bar
+                    parts = [at(2, f"{DEFENSE_TITLE}{ts()}{RST}", cols)]
+                    if sub == 0:
+                        parts.append(at(PHASE_ROW0 + 2 * (phase_idx - 1), PHASE_DONE[phase_idx - 1], cols))
+                    parts += [at(PHASE_ROW0 + 2 * phase_idx, active, cols), at(PROGRESS_ROW, progress, cols),
+                              f"\033[{PROGRESS_ROW + 2};1H"]
+                    sys.stdout.write("".join(parts))
+                    sys.stdout.flush()
 
                 time.sleep(0.4)
 
         cycle += 1
         # Brief "complete" pause
-        clr()
-        w = 74
-        print(f"{BLD}{BM}{'─'*w}{RST}")
-        print(f"{BLD}{BM} ⬡  AI DEFENSE CYCLE  —  MTD ORCHESTRATOR{RST}{'':>21}{DIM}{ts()}{RST}")
-        print(f"{BLD}{BM}{'─'*w}{RST}")
-        print()
-        print(f"  {BG}{BLD}✓ CYCLE #{cycle:04d} COMPLETE — system hardened — waiting for next alert…{RST}")
-        print()
-        for name, color, detail in PHASES:
-            print(f"  {BG}✓{RST} {BG}DONE{RST}    {BLD}{name:<26}{RST}  {DIM}{detail}{RST}")
-            print()
-        print(f"{DIM}{'─'*w}{RST}")
-        filled = 50
-        bar = f"{BG}{'█'*filled}{RST}"
-        print(f"  Progress  [{bar}] {BG}{BLD}100%{RST}")
-        print(f"{BLD}{BM}{'─'*w}{RST}")
+        out = [DEFENSE_TOP, f"{DEFENSE_TITLE}{ts()}{RST}", DEFENSE_TOP, "",
+               f"  {BG}{BLD}✓ CYCLE #{cycle:04d} COMPLETE — system hardened — waiting for next alert…{RST}", ""]
+        for row in PHASE_SUMMARY:
+            out += [row, ""]
+        out += [DEFENSE_MID, f"  Progress  [{BG}{'█'*50}{RST}] {BG}{BLD}100%{RST}", DEFENSE_TOP]
+        cols = shutil.get_terminal_size().columns
+        show([clip(row, cols) for row in out])
         time.sleep(3)
 
 
 # ─────────────────────────────────────────────
 # PANEL 4 — GPU TELEMETRY
 # ─────────────────────────────────────────────
+HISTORY_LEN = 40
+SPARK_BLOCKS = " ▁▂▃▄▅▆▇█"
+
+@njit(cache=True, fastmath=True)
+def spark_levels(ring, head, width):
+    """Block index per sample (oldest first) of a percent ring buffer; +9 marks >60%."""
+    size = ring.shape[0]
+    n = min(size, width)
+    out = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        v = ring[(head + size - n + i) % size] / np.float32(100.0)
+        lvl = min(int(v * np.float32(8.0)), 8)
+        out[i] = lvl + 9 if v > np.float32(0.6) else lvl
+    return out
+
+# Compile at import so the first tick doesn't pay for it
+spark_levels(np.zeros(HISTORY_LEN, dtype=np.float32), 0, 38)
+
+def spark_cells(lo_c, hi_c):
+    return [f"{lo_c}{b}{RST}" for b in SPARK_BLOCKS] + [f"{hi_c}{b}{RST}" for b in SPARK_BLOCKS]
+
+def sparkline(ring, head, cells, width=38):
+    return "".join([cells[i] for i in spark_levels(ring, head, width).tolist()])
+
+TELEMETRY_TOP = rule(BLD + BY)
+TELEMETRY_TITLE = f"{BLD}{BY} ⬡  GPU TELEMETRY  —  DGX SPARK  (NVIDIA Grace Hopper){RST}{'':>5}{DIM}"
+TELEMETRY_MID = rule(DIM)
+GPU_HISTORY_LABEL = f"  {DIM}GPU history (40s):{RST}"
+VRAM_HISTORY_LABEL = f"  {DIM}VRAM history (40s):{RST}"
+ACTIVE_MODEL_LINE = f"  {BLD}Active model:        {RST}  {BY}microsoft/phi-2  (2.7B){RST}    {DIM}quant: none{RST}"
+
 def panel_telemetry():
-    history_gpu = [0.0] * 40
-    history_mem = [0.0] * 40
+    history_gpu = np.zeros(HISTORY_LEN, dtype=np.float32)
+    history_mem = np.zeros(HISTORY_LEN, dtype=np.float32)
+    head = 0
+    gpu_cells = spark_cells(BG, BY)
+    rng = RngPool()
+    mem_cells = spark_cells(BC, BM)
     frame = 0
 
-    def sparkline(vals, lo_c, hi_c, width=38):
-        blocks = " ▁▂▃▄▅▆▇█"
-        norm = [v / 100.0 for v in vals[-width:]]
-        out = ""
-        for n in norm:
-            idx = min(int(n * 8), 8)
-            c = hi_c if n > 0.6 else lo_c
-            out += f"{c}{blocks[idx]}{RST}"
-        return out
-
     while True:
         # Simulate realistic GPU load (spikes during defense cycles)
         base_gpu = 30 + 20 * math.sin(frame / 10)
-        gpu_util = min(100, max(0, base_gpu + random.gauss(0, 8)))
-        mem_used = 12.4 + 3 * math.sin(frame / 8 + 1) + random.gauss(0, 0.3)
+        gpu_util = min(100, max(0, base_gpu + rng.gauss(0, 8)))
+        mem_used = 12.4 + 3 * math.sin(frame / 8 + 1) + rng.gauss(0, 0.3)
         mem_used = max(8, min(20, mem_used))
         mem_pct  = mem_used / 24 * 100
 
-        history_gpu.append(gpu_util)
-        history_mem.append(mem_pct)
-        history_gpu = history_gpu[-40:]
-        history_mem = history_mem[-40:]
+        history_gpu[head] = gpu_util
+        history_mem[head] = mem_pct
+        head = (head + 1) % HISTORY_LEN
 
-        clr()
-        w = 74
-        print(f"{BLD}{BY}{'─'*w}{RST}")
-        print(f"{BLD}{BY} ⬡  GPU TELEMETRY  —  DGX SPARK  (NVIDIA Grace Hopper){RST}{'':>5}{DIM}{ts()}{RST}")
-        print(f"{BLD}{BY}{'─'*w}{RST}")
-        print()
+        out = [TELEMETRY_TOP, f"{TELEMETRY_TITLE}{ts()}{RST}", TELEMETRY_TOP, ""]
 
         # GPU util bar
         gpu_bar_fill = int(gpu_util / 100 * 40)
         gpu_color = BR if gpu_util > 80 else (BY if gpu_util > 50 else BG)
         gpu_bar = f"{gpu_color}{'█'*gpu_bar_fill}{DIM}{'░'*(40-gpu_bar_fill)}{RST}"
-        print(f"  {BLD}GPU Utilization  {RST}[{gpu_bar}] {gpu_color}{BLD}{gpu_util:5.1f}%{RST}")
-        print()
+        out += [f"  {BLD}GPU Utilization  {RST}[{gpu_bar}] {gpu_color}{BLD}{gpu_util:5.1f}%{RST}", ""]
 
         # Mem bar
         mem_fill = int(mem_pct / 100 * 40)
         mem_color = BR if mem_pct > 80 else (BY if mem_pct > 60 else BC)
         mem_bar = f"{mem_color}{'█'*mem_fill}{DIM}{'░'*(40-mem_fill)}{RST}"
-        print(f"  {BLD}VRAM  {mem_used:.1f}GB/24GB  {RST}[{mem_bar}] {mem_color}{BLD}{mem_pct:5.1f}%{RST}")
-        print()
+        out += [f"  {BLD}VRAM  {mem_used:.1f}GB/24GB  {RST}[{mem_bar}] {mem_color}{BLD}{mem_pct:5.1f}%{RST}", ""]
 
         # Sparklines
-        print(f"  {DIM}GPU history (40s):{RST}")
-        print(f"  {sparkline(history_gpu, BG, BY)}")
-        print()
-        print(f"  {DIM}VRAM history (40s):{RST}")
-        print(f"  {sparkline(history_mem, BC, BM)}")
-        print()
+        out += [
+            GPU_HISTORY_LABEL, f"  {sparkline(history_gpu, head, gpu_cells)}", "",
+            VRAM_HISTORY_LABEL, f"  {sparkline(history_mem, head, mem_cells)}", "",
+        ]
 
         # Stats grid
-        sm_clock   = random.randint(1350, 1500)
-        mem_clock  = random.randint(1593, 1600)
-        temp       = random.randint(42, 65)
-        power      = random.randint(180, 260)
-        fan        = random.randint(35, 70)
+        sm_clock   = rng.randint(1350, 1500)
+        mem_clock  = rng.randint(1593, 1600)
+        temp       = rng.randint(42, 65)
+        power      = rng.randint(180, 260)
+        fan        = rng.randint(35, 70)
         temp_c     = BR if temp > 75 else (BY if temp > 60 else BG)
 
-        print(f"{DIM}{'─'*w}{RST}")
-        print(f"  {DIM}SM Clock   {BW}{sm_clock} MHz{RST}    {DIM}Mem Clock  {BW}{mem_clock} MHz{RST}    {DIM}Temp  {temp_c}{BLD}{temp}°C{RST}")
-        print(f"  {DIM}Power      {BW}{power}W / 300W{RST}   {DIM}Fan        {BW}{fan}%{RST}          {DIM}Pcie  {BW}Gen5 x16{RST}")
-        print()
+        out += [
+            TELEMETRY_MID,
+            f"  {DIM}SM Clock   {BW}{sm_clock} MHz{RST}    {DIM}Mem Clock  {BW}{mem_clock} MHz{RST}    {DIM}Temp  {temp_c}{BLD}{temp}°C{RST}",
+            f"  {DIM}Power      {BW}{power}W / 300W{RST}   {DIM}Fan        {BW}{fan}%{RST}          {DIM}Pcie  {BW}Gen5 x16{RST}",
+            "",
+        ]
 
         # Model info
-        infer_rate = random.randint(180, 340)
-        toks       = random.randint(1800, 3200)
-        print(f"  {BLD}Inference throughput:{RST}  {BG}{infer_rate} req/s{RST}    {BLD}vLLM tok/s:{RST}  {BC}{toks}{RST}")
-        print(f"  {BLD}Active model:        {RST}  {BY}microsoft/phi-2  (2.7B){RST}    {DIM}quant: none{RST}")
-        print()
-        print(f"{BLD}{BY}{'─'*w}{RST}")
+        infer_rate = rng.randint(180, 340)
+        toks       = rng.randint(1800, 3200)
+        out += [
+            f"  {BLD}Inference throughput:{RST}  {BG}{infer_rate} req/s{RST}    {BLD}vLLM tok/s:{RST}  {BC}{toks}{RST}",
+            ACTIVE_MODEL_LINE,
+            "",
+            TELEMETRY_TOP,
+        ]
+        show(out)
 
         frame += 1
         time.sleep(1)
@@ -11,15 +11,46 @@ Models served:
 Falls back gracefully when Triton is unreachable (dev mode).
 """
 
+import asyncio
 import time
 import logging
 import json
-from typing import Any, Dict, Optional
+import struct
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 
+# orjson (C extension) for the per-request encode/decode, stdlib fallback
+try:
+    from orjson import dumps as json_dumpb, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumpb(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 logger = logging.getLogger(__name__)
 
+LATENCY_LOG_SIZE = 10_000
+
+# struct codes for the fixed-width Triton datatypes we decode
+_STRUCT_CODES = {"FP32": "f", "FP64": "d", "INT32": "i", "INT64": "q"}
+
+
+def _decode_tensor(datatype: str, raw: bytes) -> List[Any]:
+    """Decode one binary_data tensor into a flat list of elements."""
+    if datatype == "BYTES":
+        # Each element is a 4-byte LE length followed by its bytes
+        values, pos = [], 0
+        while pos + 4 <= len(raw):
+            (n,) = struct.unpack_from("<I", raw, pos)
+            values.append(raw[pos + 4:pos + 4 + n])
+            pos += 4 + n
+        return values
+    code = _STRUCT_CODES[datatype]
+    return list(struct.unpack(f"<{len(raw) // struct.calcsize(code)}{code}", raw))
+
 
 class TritonClient:
     """
@@ -35,97 +66,227 @@ class TritonClient:
         self.base_url = f"http://{host}:{port}"
         self.timeout_s = timeout_s
         self._healthy: Optional[bool] = None
-        self._latency_log: list = []
+        # Bounded so long-running servers don't grow the log without limit
+        self._latency_log: deque = deque(maxlen=LATENCY_LOG_SIZE)
+        # One pooled keep-alive client for every call instead of a new
+        # connection per request
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout_s,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._client.close()
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """New AsyncClient for one async call; use it as `async with`.
+
+        Its connections can't outlive their event loop (and can't be closed
+        from another one), while the defense loop runs each cycle under a fresh
+        asyncio.run(), so async clients are scoped to a call, never cached.
+        """
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout_s,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
 
     def is_healthy(self) -> bool:
         """Check if Triton server is available."""
         try:
-            resp = httpx.get(
-                f"{self.base_url}/v2/health/ready",
-                timeout=2.0,
-            )
+            resp = self._client.get("/v2/health/ready", timeout=2.0)
             self._healthy = resp.status_code == 200
         except Exception:
             self._healthy = False
         return self._healthy
 
+    async def is_healthy_async(self) -> bool:
+        """Async variant of is_healthy(), for callers already on the event loop."""
+        try:
+            async with self._async_client() as client:
+                resp = await client.get("/v2/health/ready", timeout=2.0)
+            self._healthy = resp.status_code == 200
+        except Exception:
+            self._healthy = False
+        return self._healthy
+
+    @staticmethod
+    def _build_request(inputs: Dict[str, Any], outputs: Sequence[str]) -> Tuple[bytes, Dict[str, str]]:
+        """Build a Triton v2 request body using the binary_data extension.
+
+        A JSON header is followed by the raw BYTES tensor (4-byte LE length + data).
+        """
+        input_bytes = json_dumpb(inputs)
+        tensor = struct.pack("<I", len(input_bytes)) + input_bytes
+        header = json_dumpb({
+            "inputs": [
+                {
+                    "name": "INPUT",
+                    "shape": [1, 1],
+                    "datatype": "BYTES",
+                    "parameters": {"binary_data_size": len(tensor)},
+                }
+            ],
+            "outputs": [
+                {"name": name, "parameters": {"binary_data": True}} for name in outputs
+            ],
+        })
+        headers = {
+            "Content-Type": "application/octet-stream",
+            "Inference-Header-Content-Length": str(len(header)),
+        }
+        return header + tensor, headers
+
+    def _log_latency(self, model_name: str, t_start_ns: int, ts: float) -> None:
+        latency_ms = (time.perf_counter_ns() - t_start_ns) / 1e6
+        self._latency_log.append({
+            "model": model_name,
+            "latency_ms": latency_ms,
+            "timestamp": ts,
+        })
+        logger.info(
+            f"[TritonClient] {model_name} inference: {latency_ms:.1f}ms"
+        )
+
     def infer(
         self,
         model_name: str,
         inputs: Dict[str, Any],
         model_version: str = "1",
+        outputs: Sequence[str] = ("OUTPUT",),
     ) -> Dict[str, Any]:
         """
         Send inference request to Triton model.
         Uses Triton HTTP Inference Protocol v2.
 
-        Returns model output dict.
+        Returns model output dict: JSON BYTES/UINT8 outputs are merged into
+        it, numeric outputs are added as a flat list under the output name.
         """
-        t_start = time.time()
-
-        # Build Triton v2 request payload
-        # For hackathon: using BYTES input type (JSON-serialized context)
-        input_bytes = json.dumps(inputs).encode("utf-8")
-        payload = {
-            "inputs": [
-                {
-                    "name": "INPUT",
-                    "shape": [1, len(input_bytes)],
-                    "datatype": "BYTES",
-                    "data": [input_bytes.decode("utf-8")],
-                }
-            ],
-            "outputs": [{"name": "OUTPUT"}],
-        }
+        t_start_ns = time.perf_counter_ns()
+        ts = time.time()
+        body, headers = self._build_request(inputs, outputs)
 
         try:
-            resp = httpx.post(
-                f"{self.base_url}/v2/models/{model_name}/infer",
-                json=payload,
-                timeout=self.timeout_s,
+            resp = self._client.post(
+                f"/v2/models/{model_name}/infer", content=body, headers=headers
             )
             resp.raise_for_status()
-            latency_ms = (time.time() - t_start) * 1000
-            self._latency_log.append({
-                "model": model_name,
-                "latency_ms": latency_ms,
-                "timestamp": t_start,
-            })
-            logger.info(
-                f"[TritonClient] {model_name} inference: {latency_ms:.1f}ms"
-            )
+            self._log_latency(model_name, t_start_ns, ts)
+            return self._parse_outputs(resp)
+
+        except Exception as e:
+            latency_ms = (time.perf_counter_ns() - t_start_ns) / 1e6
+            logger.warning(f"[TritonClient] {model_name} error ({latency_ms:.1f}ms): {e}")
+            raise
 
-            output = resp.json()
-            # Parse output bytes back to dict
-            raw = output.get("outputs", [{}])[0].get("data", ["{}"])[0]
-            return json.loads(raw) if isinstance(raw, str) else {}
+    async def infer_async(
+        self,
+        model_name: str,
+        inputs: Dict[str, Any],
+        model_version: str = "1",
+        outputs: Sequence[str] = ("OUTPUT",),
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of infer(); same request and return format.
+
+        Pass an open `client` to share its connection pool (infer_many does);
+        otherwise a client is opened and closed around this one request.
+        """
+        if client is None:
+            async with self._async_client() as client:
+                return await self.infer_async(model_name, inputs, model_version, outputs, client)
+
+        t_start_ns = time.perf_counter_ns()
+        ts = time.time()
+        body, headers = self._build_request(inputs, outputs)
+
+        try:
+            resp = await client.post(
+                f"/v2/models/{model_name}/infer", content=body, headers=headers
+            )
+            resp.raise_for_status()
+            self._log_latency(model_name, t_start_ns, ts)
+            return self._parse_outputs(resp)
 
         except Exception as e:
-            latency_ms = (time.time() - t_start) * 1000
+            latency_ms = (time.perf_counter_ns() - t_start_ns) / 1e6
             logger.warning(f"[TritonClient] {model_name} error ({latency_ms:.1f}ms): {e}")
             raise
 
+    async def infer_many(
+        self,
+        model_name: str,
+        inputs_list: Sequence[Dict[str, Any]],
+        model_version: str = "1",
+        outputs: Sequence[str] = ("OUTPUT",),
+    ) -> List[Dict[str, Any]]:
+        """
+        Send all requests at once so Triton's dynamic batcher can merge them
+        into one execute() call. Results are in input order.
+        """
+        async with self._async_client() as client:
+            return list(await asyncio.gather(*[
+                self.infer_async(model_name, inputs, model_version, outputs, client)
+                for inputs in inputs_list
+            ]))
+
+    @staticmethod
+    def _parse_outputs(resp: httpx.Response) -> Dict[str, Any]:
+        """Split a binary_data response at its header and decode each output."""
+        body = resp.content
+        header_len = resp.headers.get("Inference-Header-Content-Length")
+        header_len = int(header_len) if header_len is not None else len(body)
+        header = json_loads(body[:header_len])
+
+        result: Dict[str, Any] = {}
+        offset = header_len
+        for out in header.get("outputs", []):
+            datatype = out.get("datatype", "BYTES")
+            size = out.get("parameters", {}).get("binary_data_size")
+            if size is None:
+                data = out.get("data", [])
+                raw = bytes(data) if datatype == "UINT8" else None
+            else:
+                raw = body[offset:offset + size]
+                offset += size
+                data = None
+            if datatype == "UINT8":
+                # UINT8 outputs carry one JSON document as contiguous bytes
+                docs = [raw]
+            elif datatype == "BYTES":
+                docs = _decode_tensor(datatype, raw) if data is None else data
+            else:
+                result[out["name"]] = _decode_tensor(datatype, raw) if data is None else data
+                continue
+            for doc in docs:
+                decoded = json_loads(doc)
+                if isinstance(decoded, dict):
+                    result.update(decoded)
+        return result
+
     def get_model_stats(self, model_name: str) -> Dict[str, Any]:
         """Fetch Triton model statistics for benchmarking."""
         try:
-            resp = httpx.get(
-                f"{self.base_url}/v2/models/{model_name}/stats",
+            resp = self._client.get(
+                f"/v2/models/{model_name}/stats",
                 timeout=5.0,
             )
             resp.raise_for_status()
-            return resp.json()
+            return json_loads(resp.content)
         except Exception as e:
             logger.warning(f"[TritonClient] Stats error for {model_name}: {e}")
             return {}
 
     def get_latency_log(self) -> list:
         """Return logged inference latencies for telemetry."""
-        return self._latency_log.copy()
+        return list(self._latency_log)
 
     def get_server_metrics(self) -> str:
         """Fetch Prometheus metrics from Triton (for GPU utilization etc.)."""
         try:
-            resp = httpx.get(f"{self.base_url}/metrics", timeout=5.0)
+            resp = self._client.get("/metrics", timeout=5.0)
             return resp.text
         except Exception:
             return ""
@@ -18,14 +18,27 @@ TRT-LLM requires only changing this client. Both expose OpenAI-compatible
 APIs. TRT-LLM is the preferred production path for maximum DGX throughput.
 """
 
+import json
 import time
 import logging
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, Iterator
 
 import httpx
 
+# orjson (C extension) for the per-request encode/decode, stdlib fallback
+try:
+    from orjson import dumps as json_dumpb, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumpb(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 logger = logging.getLogger(__name__)
 
+LATENCY_LOG_SIZE = 10_000
+
 
 class VLLMClient:
     """
@@ -38,16 +51,43 @@ class VLLMClient:
         port: int = 8088,
         model: str = "microsoft/phi-2",
         timeout_s: float = 30.0,
+        system_prompt: Optional[str] = None,
     ):
-        self.base_url = f"http://{host}:{port}/v1"
+        self.server_url = f"http://{host}:{port}"
+        self.base_url = f"{self.server_url}/v1"
         self.model = model
         self.timeout_s = timeout_s
-        self._latency_log: list = []
+        # Default system prompt; its request prefix is serialized once here
+        self.system_prompt = system_prompt
+        self._prefix_bytes = self._build_prefix(system_prompt)
+        # Bounded so long-running servers don't grow the log without limit
+        self._latency_log: deque = deque(maxlen=LATENCY_LOG_SIZE)
+        # One pooled keep-alive client for every call instead of a new
+        # connection per request
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout_s,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._client.close()
+
+    def _build_prefix(self, system_prompt: Optional[str]) -> bytes:
+        """
+        Serialize the constant head of a streaming chat request, cut open
+        inside the messages array so per-call messages can be appended.
+        """
+        messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        head = json_dumpb({"model": self.model, "stream": True, "messages": messages})
+        # Drop the closing `]}`; add the separator for the next message
+        return head[:-2] + (b"," if messages else b"")
 
     def is_healthy(self) -> bool:
         """Check if vLLM server is available."""
         try:
-            resp = httpx.get(f"http://{self.base_url.split('/v1')[0]}/health", timeout=2.0)
+            resp = self._client.get(f"{self.server_url}/health", timeout=2.0)
             return resp.status_code == 200
         except Exception:
             return False
@@ -66,60 +106,92 @@ class VLLMClient:
             prompt: Input prompt
             max_tokens: Max tokens to generate
             temperature: Sampling temperature (low = deterministic)
-            system_prompt: Optional system message
+            system_prompt: Optional system message (defaults to the client's)
 
         Returns:
             Generated text string
         """
-        t_start = time.time()
-
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        return "".join(
+            self.complete_stream(prompt, max_tokens, temperature, system_prompt)
+        )
 
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "stream": False,
-        }
+    def complete_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 256,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Stream a completion from the local vLLM server over SSE.
 
+        Yields each delta's text as it arrives, so callers can render tokens
+        before generation finishes. Time to first token and total time are
+        logged separately.
+        """
+        t_start_ns = time.perf_counter_ns()
+        ts = time.time()
+
+        if system_prompt is None or system_prompt == self.system_prompt:
+            prefix = self._prefix_bytes
+        else:
+            prefix = self._build_prefix(system_prompt)
+        body = b"".join((
+            prefix,
+            json_dumpb({"role": "user", "content": prompt}),
+            b'],"max_tokens":', json_dumpb(max_tokens),
+            b',"temperature":', json_dumpb(temperature),
+            b"}",
+        ))
+
+        ttft_ms = None
         try:
-            resp = httpx.post(
-                f"{self.base_url}/chat/completions",
-                json=payload,
-                timeout=self.timeout_s,
-            )
-            resp.raise_for_status()
-
-            latency_ms = (time.time() - t_start) * 1000
-            self._latency_log.append({
-                "operation": "complete",
-                "latency_ms": latency_ms,
-                "tokens": max_tokens,
-                "timestamp": t_start,
-            })
-            logger.info(f"[VLLMClient] Completion in {latency_ms:.1f}ms")
-
-            data = resp.json()
-            return data["choices"][0]["message"]["content"]
+            with self._client.stream(
+                "POST",
+                "/chat/completions",
+                content=body,
+                headers={"Content-Type": "application/json"},
+            ) as resp:
+                resp.raise_for_status()
+                for line in resp.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = json_loads(data).get("choices") or [{}]
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        if ttft_ms is None:
+                            ttft_ms = (time.perf_counter_ns() - t_start_ns) / 1e6
+                        yield delta
 
         except Exception as e:
-            latency_ms = (time.time() - t_start) * 1000
+            latency_ms = (time.perf_counter_ns() - t_start_ns) / 1e6
             logger.warning(f"[VLLMClient] Error ({latency_ms:.1f}ms): {e}")
             raise
 
+        total_ms = (time.perf_counter_ns() - t_start_ns) / 1e6
+        self._latency_log.append({
+            "operation": "complete",
+            "latency_ms": total_ms,
+            "ttft_ms": ttft_ms,
+            "total_ms": total_ms,
+            "tokens": max_tokens,
+            "timestamp": ts,
+        })
+        ttft = f"{ttft_ms:.1f}ms" if ttft_ms is not None else "n/a"
+        logger.info(f"[VLLMClient] Completion in {total_ms:.1f}ms (first token {ttft})")
+
     def get_latency_log(self) -> list:
         """Return logged inference latencies for telemetry."""
-        return self._latency_log.copy()
+        return list(self._latency_log)
 
     def get_models(self) -> list:
         """List available models on vLLM server."""
         try:
-            resp = httpx.get(f"{self.base_url}/models", timeout=5.0)
+            resp = self._client.get("/models", timeout=5.0)
             resp.raise_for_status()
-            return resp.json().get("data", [])
+            return json_loads(resp.content).get("data", [])
         except Exception:
             return []
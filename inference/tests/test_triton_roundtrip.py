@@ -0,0 +1,229 @@
+"""
+Round-trip tests for the Triton inference path.
+Drives the real TritonClient against the real Python-backend models through an
+in-process stand-in for Triton's HTTP v2 frontend, so the wire format the
+client emits (binary_data, [1, 1] BYTES input) is exactly what the backends
+decode, and the backends' outputs are exactly what the client parses.
+"""
+import asyncio
+import importlib.util
+import json
+import struct
+import sys
+import types
+from pathlib import Path
+
+import httpx
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MODEL_REPO = REPO_ROOT / "inference" / "triton-model-repo"
+sys.path.insert(0, str(REPO_ROOT))
+
+from inference.clients.triton_client import TritonClient  # noqa: E402
+
+
+# ─── Triton stand-in ─────────────────────────────────────────────────────────
+
+class _Tensor:
+    def __init__(self, name, array):
+        self._name = name
+        self._array = array
+
+    def name(self):
+        return self._name
+
+    def as_numpy(self):
+        return self._array
+
+
+class _InferenceResponse:
+    def __init__(self, output_tensors=None, error=None):
+        self.output_tensors = output_tensors or []
+        self.error = error
+
+
+class _Request:
+    def __init__(self, inputs):
+        self.inputs = inputs
+
+
+def _json_request(ctx):
+    """A request carrying `ctx` as the [1, 1] BYTES INPUT TritonClient sends."""
+    raw = np.array([json.dumps(ctx).encode()], dtype=object).reshape(1, 1)
+    return _Request({"INPUT": _Tensor("INPUT", raw)})
+
+
+def _install_pb_utils():
+    pb_utils = types.ModuleType("triton_python_backend_utils")
+    pb_utils.Tensor = _Tensor
+    pb_utils.InferenceResponse = _InferenceResponse
+    pb_utils.TritonError = RuntimeError
+    pb_utils.get_input_tensor_by_name = lambda request, name: request.inputs.get(name)
+    sys.modules["triton_python_backend_utils"] = pb_utils
+
+
+def _load_model(name):
+    _install_pb_utils()
+    spec = importlib.util.spec_from_file_location(
+        f"triton_{name.replace('-', '_')}", MODEL_REPO / name / "1" / "model.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    model = module.TritonPythonModel()
+    model.initialize({"model_config": "{}"})
+    return model
+
+
+_DATATYPES = {np.dtype(np.float32): "FP32", np.dtype(np.uint8): "UINT8"}
+
+
+def _decode_input(spec, raw):
+    # BYTES tensor: each element is a 4-byte little-endian length + data,
+    # materialized as an object array with the shape the header declares
+    elements, offset = [], 0
+    while offset < len(raw):
+        (n,) = struct.unpack_from("<I", raw, offset)
+        elements.append(raw[offset + 4:offset + 4 + n])
+        offset += 4 + n
+    return np.array(elements, dtype=object).reshape(spec["shape"])
+
+
+def _encode_output(tensor):
+    array = tensor.as_numpy()
+    return {"name": tensor.name(), "datatype": _DATATYPES[array.dtype],
+            "shape": list(array.shape)}, array.tobytes()
+
+
+def _transport(models):
+    def handler(request):
+        if request.url.path == "/v2/health/ready":
+            return httpx.Response(200)
+        model = models[request.url.path.split("/")[3]]
+        header_len = int(request.headers["Inference-Header-Content-Length"])
+        header = json.loads(request.content[:header_len])
+        offset, inputs = header_len, {}
+        for spec in header["inputs"]:
+            size = spec["parameters"]["binary_data_size"]
+            inputs[spec["name"]] = _Tensor(
+                spec["name"], _decode_input(spec, request.content[offset:offset + size])
+            )
+            offset += size
+
+        (response,) = model.execute([_Request(inputs)])
+        assert response.error is None, response.error
+        wanted = {out["name"] for out in header["outputs"]}
+        outputs, blob = [], b""
+        for tensor in response.output_tensors:
+            if tensor.name() not in wanted:
+                continue
+            out, data = _encode_output(tensor)
+            out["parameters"] = {"binary_data_size": len(data)}
+            outputs.append(out)
+            blob += data
+        body = json.dumps({"outputs": outputs}).encode()
+        return httpx.Response(
+            200, content=body + blob,
+            headers={"Inference-Header-Content-Length": str(len(body))},
+        )
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture(scope="module")
+def models():
+    return {name: _load_model(name) for name in ("risk-scorer", "mutation-planner")}
+
+
+@pytest.fixture(scope="module")
+def client(models):
+    c = TritonClient(host="triton.test")
+    transport = _transport(models)
+    c._client = httpx.Client(base_url=c.base_url, transport=transport)
+    c._async_client = lambda: httpx.AsyncClient(base_url=c.base_url, transport=transport)
+    yield c
+    c.close()
+    for model in models.values():
+        model.finalize()
+
+
+# ─── risk-scorer ─────────────────────────────────────────────────────────────
+
+class TestRiskScorerRoundTrip:
+    def test_strong_candidate_scores_high(self, client):
+        resp = client.infer("risk-scorer", {
+            "exploit_success_rate": 0.0, "tests_passed": 25, "total_tests": 25,
+            "bandit_issues": 0, "model_confidence": 0.9,
+        }, outputs=("SCORES", "META"))
+        assert len(resp["SCORES"]) == 4
+        assert resp["SCORES"][0] >= 0.8
+
+    def test_weak_candidate_scores_lower(self, client):
+        strong = client.infer("risk-scorer", {
+            "exploit_success_rate": 0.0, "tests_passed": 25, "total_tests": 25,
+            "bandit_issues": 0, "model_confidence": 0.9,
+        }, outputs=("SCORES",))
+        weak = client.infer("risk-scorer", {
+            "exploit_success_rate": 1.0, "tests_passed": 5, "total_tests": 25,
+            "bandit_issues": 3, "model_confidence": 0.1,
+        }, outputs=("SCORES",))
+        assert weak["SCORES"][0] < strong["SCORES"][0]
+
+    def test_infer_many_keeps_input_order(self, client):
+        inputs = [
+            {"exploit_success_rate": rate, "tests_passed": 25, "total_tests": 25,
+             "bandit_issues": 0, "model_confidence": 0.9}
+            for rate in (1.0, 0.0, 0.5)
+        ]
+
+        async def score_all():
+            assert await client.is_healthy_async()
+            return await client.infer_many("risk-scorer", inputs, outputs=("SCORES",))
+
+        batched = asyncio.run(score_all())
+        serial = [client.infer("risk-scorer", i, outputs=("SCORES",)) for i in inputs]
+        assert [r["SCORES"] for r in batched] == [r["SCORES"] for r in serial]
+
+
+# ─── mutation-planner ────────────────────────────────────────────────────────
+
+class TestMutationPlannerRoundTrip:
+    def test_plan_has_requested_length(self, client):
+        resp = client.infer("mutation-planner", {
+            "payload_type": "path-traversal", "endpoint": "/data", "count": 6,
+        })
+        assert resp["backend"] == "triton-python"
+        assert len(resp["recommended_sequence"]) == 6
+        assert set(resp["transform_scores"]) >= set(resp["recommended_sequence"])
+
+    def test_scores_depend_on_attack_context(self, client):
+        scores = {
+            payload: client.infer("mutation-planner", {
+                "payload_type": payload, "endpoint": "/data", "count": 4,
+            })["transform_scores"]
+            for payload in ("path-traversal", "sql-injection")
+        }
+        assert scores["path-traversal"] != scores["sql-injection"]
+
+    def test_same_context_reuses_cached_plan(self, client, models):
+        planner = models["mutation-planner"]
+        ctx = {"payload_type": "command-injection", "endpoint": "/run", "count": 5}
+        first = client.infer("mutation-planner", ctx)
+        cached = len(planner._plan_cache)
+        second = client.infer("mutation-planner", ctx)
+        assert second == first
+        assert len(planner._plan_cache) == cached
+
+    def test_bad_count_fails_only_its_own_request(self, models):
+        good, bad, negative, missing = models["mutation-planner"].execute([
+            _json_request({"payload_type": "sql-injection", "endpoint": "/search", "count": 3}),
+            _json_request({"payload_type": "sql-injection", "endpoint": "/search", "count": "many"}),
+            _json_request({"payload_type": "sql-injection", "endpoint": "/search", "count": -4}),
+            _Request({}),
+        ])
+        assert good.error is None
+        assert len(json.loads(good.output_tensors[0].as_numpy().tobytes())["recommended_sequence"]) == 3
+        assert bad.error is not None and "count" in str(bad.error)
+        assert negative.error is None
+        assert json.loads(negative.output_tensors[0].as_numpy().tobytes())["recommended_sequence"] == []
+        assert missing.error is not None
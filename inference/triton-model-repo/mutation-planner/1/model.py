@@ -6,21 +6,31 @@ Planner cascade (NeMo LLM → host MLP → THIS → deterministic).
 
 It serves the SAME GPU-trained MLP policy that core/training/train.py produces:
 the trained weights (`planner.npz`) are exported into this version directory, and
-this model runs the forward pass on Triton — real served weights, batched on the
-GPU, NOT a hardcoded formula. If no trained weights are present yet (cold start),
-it falls back to a deterministic weighted prior so the cycle always completes.
+this model runs the forward pass on Triton — real served weights, batched by
+Triton's dynamic batcher, NOT a hardcoded formula. If no trained weights are
+present yet (cold start), it falls back to a deterministic weighted prior so the
+cycle always completes.
 
 Input  (BYTES, JSON): {"payload_type": "...", "endpoint": "...", "count": N}
-Output (BYTES, JSON): {"transform_scores": {transform: score}, "recommended_sequence": [...], "model": "...", "backend": "triton-python"}
+Output (UINT8, JSON bytes): {"transform_scores": {transform: score}, "recommended_sequence": [...], "model": "...", "backend": "triton-python"}
 """
 
+import hashlib
 import json
 import os
-import random
 
 import numpy as np
 import triton_python_backend_utils as pb_utils
 
+# orjson (C extension) for the per-request encode/decode, stdlib fallback
+try:
+    from orjson import dumps as json_dumpb, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumpb(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 # ── Feature contract — MUST match core/training/features.py exactly ──────────
 PAYLOAD_TYPES = ["path-traversal", "command-injection", "sql-injection", "unknown"]
 ENDPOINTS = ["/data", "/run", "/search", "unknown"]
@@ -44,6 +54,11 @@ PRIOR_WEIGHTS = {
     "reorder_blocks": 0.10, "split_helpers": 0.05,
 }
 
+# Serialized plans kept per (pair, seed, count); oldest entries evicted first.
+_PLAN_CACHE_SIZE = 4096
+# Requested sequence lengths are clamped to [0, _MAX_PLAN_COUNT]
+_MAX_PLAN_COUNT = 256
+
 _HERE = os.path.dirname(os.path.abspath(__file__))
 _WEIGHTS_PATH = os.path.join(_HERE, "planner.npz")
 
@@ -71,6 +86,45 @@ def _encode(payload_type, endpoint):
     )
 
 
+def _parse_input(request):
+    """Return a request's raw INPUT bytes and decoded JSON; malformed JSON becomes {}.
+
+    Returns (None, {}) if the INPUT tensor is missing or unreadable.
+    """
+    try:
+        # INPUT arrives as a [1, 1] BYTES tensor (batch dim + one element)
+        tensor = pb_utils.get_input_tensor_by_name(request, "INPUT")
+        raw = bytes(tensor.as_numpy().reshape(-1)[0])
+    except Exception:
+        return None, {}
+    try:
+        ctx = json_loads(raw)
+    except Exception:
+        return raw, {}
+    return raw, ctx if isinstance(ctx, dict) else {}
+
+
+def _seed(raw):
+    """Stable 32-bit RNG seed from the raw INPUT bytes (unlike hash(), not salted per process).
+
+    `raw` must be the element's bytes: hashing the ndarray would hash its
+    object pointers, giving a new seed (and a plan-cache miss) per request.
+    """
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "little") & 0xFFFFFFFF
+
+
+def _uniforms(seed, count):
+    """`count` uniforms in [0, 1) from a SHAKE-128 stream keyed by the seed.
+
+    Deterministic per seed like a seeded Generator, without paying for a new
+    SeedSequence + PCG64 per plan.
+    """
+    words = np.frombuffer(
+        hashlib.shake_128(seed.to_bytes(4, "little")).digest(8 * count), dtype="<u8"
+    )
+    return (words >> np.uint64(11)) * (1.0 / (1 << 53))
+
+
 class TritonPythonModel:
 
     def initialize(self, args):
@@ -86,6 +140,36 @@ class TritonPythonModel:
             except Exception:
                 self._trained = False
 
+        # Scores depend only on the normalized (payload, endpoint) pair, so the
+        # ranked transforms and their sampling CDF are built once per pair and
+        # stacked into (pairs, transforms) arrays for batched lookups
+        self._pair_index = {}
+        self._pair_heads = []
+        ranked_rows, cdf_rows = [], []
+        for payload_type in PAYLOAD_TYPES:
+            for endpoint in ENDPOINTS:
+                scores, self._model_name = self._scores(payload_type, endpoint)
+                ranked = sorted(scores, key=scores.get, reverse=True)
+                cdf = np.cumsum(np.maximum([scores[t] for t in ranked], 0.0))
+                self._pair_index[(payload_type, endpoint)] = len(self._pair_heads)
+                # Response JSON up to the sequence: `{"transform_scores":{..},"recommended_sequence":`
+                self._pair_heads.append(
+                    json_dumpb({"transform_scores": scores})[:-1] + b',"recommended_sequence":'
+                )
+                ranked_rows.append(ranked)
+                cdf_rows.append(cdf / cdf[-1])
+        self._ranked = np.array(ranked_rows)
+        self._cdf = np.stack(cdf_rows)
+        # Response JSON after the sequence: `,"model":..,"backend":..,"trained":..}`
+        self._plan_tail = b"," + json_dumpb({
+            "model": self._model_name,
+            "backend": "triton-python",
+            "trained": self._trained,
+        })[1:]
+        # A plan is fully determined by (pair, seed, count), so repeated
+        # contexts reuse the already-serialized response bytes
+        self._plan_cache = {}
+
     def _forward(self, x):
         h = np.maximum(x @ self._W1 + self._b1, 0.0)
         z = h @ self._W2 + self._b2
@@ -98,36 +182,72 @@ class TritonPythonModel:
         # cold-start prior
         return dict(PRIOR_WEIGHTS), "weighted-prior-v0"
 
+    def _plan_batch(self, keys):
+        """Serialize the plans for a list of (pair, seed, count) keys."""
+        pairs = np.array([pair for pair, _, _ in keys])
+        counts = np.array([count for _, _, count in keys])
+
+        # Build the recommended sequences biased toward the highest scores.
+        # Each plan draws its uniforms from its own seeded stream, then
+        # every slot of the batch is mapped through its pair's CDF at once.
+        u = np.concatenate([_uniforms(seed, count) for _, seed, count in keys])
+        slot_pairs = np.repeat(pairs, counts)
+        idx = (self._cdf[slot_pairs] <= u[:, None]).sum(axis=1)
+        seqs = np.split(self._ranked[slot_pairs, idx], np.cumsum(counts)[:-1])
+
+        # Only the sequence is serialized per plan; the constant head (scores)
+        # and tail (tags) were serialized once per pair in initialize().
+        return [
+            b"".join((self._pair_heads[pair], json_dumpb(seq.tolist()), self._plan_tail))
+            for pair, seq in zip(pairs, seqs)
+        ]
+
+    def _plans(self, keys):
+        """Map each key to its serialized plan, building only cache misses."""
+        plans = {key: self._plan_cache.get(key) for key in keys}
+        misses = [key for key, plan in plans.items() if plan is None]
+        if misses:
+            for key, plan in zip(misses, self._plan_batch(misses)):
+                plans[key] = plan
+                if len(self._plan_cache) >= _PLAN_CACHE_SIZE:
+                    del self._plan_cache[next(iter(self._plan_cache))]
+                self._plan_cache[key] = plan
+        return plans
+
+    def _plan_key(self, request):
+        """(pair, seed, count) for one request; raises ValueError on unusable input."""
+        raw, ctx = _parse_input(request)
+        if raw is None:
+            raise ValueError("missing or unreadable INPUT tensor")
+        try:
+            count = int(ctx.get("count", 10))
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"count must be an integer, got {ctx.get('count')!r}")
+        pair = self._pair_index[(_norm_payload(ctx.get("payload_type")), _norm_endpoint(ctx.get("endpoint")))]
+        return pair, _seed(raw), max(0, min(count, _MAX_PLAN_COUNT))
+
     def execute(self, requests):
-        responses = []
-        for request in requests:
-            in_tensor = pb_utils.get_input_tensor_by_name(request, "INPUT")
-            raw = in_tensor.as_numpy()[0].decode("utf-8")
+        # Keys are validated per request, so a bad request gets its own error
+        # response instead of failing everything batched with it
+        keys, errors = [], {}
+        for i, request in enumerate(requests):
             try:
-                ctx = json.loads(raw)
-            except Exception:
-                ctx = {}
-
-            count = int(ctx.get("count", 10))
-            scores, model_name = self._scores(ctx.get("payload_type"), ctx.get("endpoint"))
-
-            # Build a recommended sequence biased toward the highest scores.
-            ranked = sorted(scores, key=scores.get, reverse=True)
-            total = sum(max(s, 0.0) for s in scores.values()) or 1.0
-            rng = random.Random(hash(str(ctx)) % 10000)
-            seq = rng.choices(ranked, weights=[max(scores[t], 0.0) / total for t in ranked], k=count)
-
-            result = {
-                "transform_scores": scores,
-                "recommended_sequence": seq,
-                "model": model_name,
-                "backend": "triton-python",
-                "trained": self._trained,
-            }
-            out_bytes = json.dumps(result).encode("utf-8")
-            out_tensor = pb_utils.Tensor("OUTPUT", np.array([out_bytes], dtype=object))
-            responses.append(pb_utils.InferenceResponse(output_tensors=[out_tensor]))
-        return responses
+                keys.append(self._plan_key(request))
+            except ValueError as e:
+                keys.append(None)
+                errors[i] = pb_utils.TritonError(f"mutation-planner: {e}")
+        try:
+            plans = self._plans([key for key in keys if key is not None])
+        except Exception as e:
+            error = pb_utils.TritonError(f"mutation-planner: {e}")
+            return [pb_utils.InferenceResponse(error=error) for _ in requests]
+        return [
+            pb_utils.InferenceResponse(error=errors[i]) if key is None
+            else pb_utils.InferenceResponse(output_tensors=[
+                pb_utils.Tensor("OUTPUT", np.frombuffer(plans[key], dtype=np.uint8)[None, :])
+            ])
+            for i, key in enumerate(keys)
+        ]
 
     def finalize(self):
         pass
@@ -5,11 +5,12 @@ Python backend for Triton Inference Server. Scores a mutation candidate's
 deployment confidence by running the logistic-regression risk model trained on
 real defense-cycle outcomes (core/training/train_risk.py). The trained weights
 (`risk.npz`) are exported into this version directory and run here — a real
-served model, batched on the GPU. If weights are absent (cold start), it falls
-back to the original weighted formula so scoring always works.
+served model, batched by Triton's dynamic batcher. If weights are absent (cold
+start), it falls back to the original weighted formula so scoring always works.
 
 Input  (BYTES, JSON): {"exploit_success_rate":.., "tests_passed":.., "total_tests":.., "bandit_issues":.., "model_confidence":..}
-Output (BYTES, JSON): {"confidence_score":.., "risk_score":.., "model":.., "backend":"triton-python", "trained": bool}
+Output SCORES (FP32[4]): [confidence_score, risk_score, security term, correctness term]
+Output META  (UINT8, JSON bytes, fixed at load): {"model":.., "backend":"triton-python", "trained": bool}
 """
 
 import json
@@ -18,12 +19,61 @@ import os
 import numpy as np
 import triton_python_backend_utils as pb_utils
 
+# orjson (C extension) for the per-request encode/decode, stdlib fallback
+try:
+    from orjson import dumps as json_dumpb, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumpb(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# numba is optional: without it the scoring kernel just runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return args[0] if args and callable(args[0]) else (lambda fn: fn)
+
 _HERE = os.path.dirname(os.path.abspath(__file__))
 _WEIGHTS_PATH = os.path.join(_HERE, "risk.npz")
 
 
-def _sigmoid(z):
-    return 1.0 / (1.0 + np.exp(-z))
+@njit(cache=True, nogil=True, fastmath=True)
+def _score_kernel(expl, tp, tt, bandit, mconf, w, b, trained, coef, out):
+    """Fill out[i] = [confidence, risk, security term, correctness term].
+
+    coef = [w_sec, w_corr, w_bandit, bandit_cap, w_mconf]. Compiled without
+    the GIL so it doesn't hold up other threads while it runs.
+    """
+    for i in range(expl.shape[0]):
+        sec = 1.0 - expl[i]
+        corr = tp[i] / max(tt[i], 1.0)
+        pen = min(bandit[i] * coef[2], coef[3])
+        if trained:
+            base = 1.0 / (1.0 + np.exp(-(sec * w[0] + corr * w[1] + b)))
+        else:
+            # cold-start formula (mirrors RiskAgent)
+            base = sec * coef[0] + corr * coef[1] + mconf[i] * coef[4]
+        s = base - pen
+        if s < 0.0:
+            s = 0.0
+        elif s > 1.0:
+            s = 1.0
+        out[i, 0] = s
+        out[i, 1] = 1.0 - s
+        out[i, 2] = sec * coef[0]
+        out[i, 3] = corr * coef[1]
+
+
+def _parse_input(request):
+    """Decode a request's JSON INPUT tensor; malformed input becomes {}."""
+    try:
+        # INPUT arrives as a [1, 1] BYTES tensor (batch dim + one element)
+        tensor = pb_utils.get_input_tensor_by_name(request, "INPUT")
+        return json_loads(tensor.as_numpy().reshape(-1)[0])
+    except Exception:
+        return {}
 
 
 class TritonPythonModel:
@@ -36,57 +86,64 @@ class TritonPythonModel:
             try:
                 data = np.load(_WEIGHTS_PATH, allow_pickle=False)
                 self._w = data["w"].astype(np.float32)
-                self._b = float(data["b"])
+                self._b = np.float32(data["b"])
                 self._trained = True
             except Exception:
                 self._trained = False
-
-    def _features(self, ctx):
-        exploit_rate = float(ctx.get("exploit_success_rate", 1.0))
-        test_pass = float(ctx.get("tests_passed", 0))
-        test_total = float(ctx.get("total_tests", 1))
-        security = 1.0 - exploit_rate
-        correctness = test_pass / max(test_total, 1.0)
-        return np.asarray([security, correctness], dtype=np.float32), security, correctness
-
-    def _score(self, ctx):
-        x, security, correctness = self._features(ctx)
-        bandit_penalty = min(float(ctx.get("bandit_issues", 0)) * 0.05, 0.30)
-
-        if self._trained:
-            base = float(_sigmoid(float(x @ self._w + self._b)))
-            model_name = "risk-logreg-v1"
-        else:
-            # cold-start formula (mirrors RiskAgent)
-            model_bonus = float(ctx.get("model_confidence", 0.75)) * 0.05
-            base = security * 0.60 + correctness * 0.40 + model_bonus
-            model_name = "risk-formula-v0"
-
-        score = max(0.0, min(1.0, base - bandit_penalty))
-        return score, model_name
+        if not self._trained:
+            # Typed placeholders so the kernel compiles once for both paths
+            self._w, self._b = np.zeros(2, dtype=np.float32), np.float32(0.0)
+        # Formula coefficients as float32: [w_sec, w_corr, w_bandit, bandit_cap, w_mconf]
+        self._coef = np.array([0.60, 0.40, 0.05, 0.30, 0.05], dtype=np.float32)
+        # Compile the kernel now rather than on the first request
+        self._score_batch([{}])
+        # Tags are constant for the life of the instance, so serialize once
+        self._meta = np.frombuffer(json_dumpb({
+            "model": "risk-logreg-v1" if self._trained else "risk-formula-v0",
+            "backend": "triton-python",
+            "trained": self._trained,
+        }), dtype=np.uint8)[None, :]
+
+    def _score_batch(self, ctxs):
+        """Score every request context in one pass; returns an (N, 4) float32 array."""
+        n = len(ctxs)
+        exploit_rate = np.empty(n, dtype=np.float32)
+        tests_passed = np.empty(n, dtype=np.float32)
+        tests_total = np.empty(n, dtype=np.float32)
+        bandit = np.empty(n, dtype=np.float32)
+        model_conf = np.empty(n, dtype=np.float32)
+        for i, ctx in enumerate(ctxs):
+            exploit_rate[i] = float(ctx.get("exploit_success_rate", 1.0))
+            tests_passed[i] = float(ctx.get("tests_passed", 0))
+            tests_total[i] = float(ctx.get("total_tests", 1))
+            bandit[i] = float(ctx.get("bandit_issues", 0))
+            model_conf[i] = float(ctx.get("model_confidence", 0.75))
+
+        out = np.empty((n, 4), dtype=np.float32)
+        _score_kernel(
+            exploit_rate, tests_passed, tests_total, bandit, model_conf,
+            self._w, self._b, self._trained, self._coef, out,
+        )
+        return out
+
+    def _build_responses(self, ctxs):
+        """Score the whole batch; one InferenceResponse per request."""
+        scores = self._score_batch(ctxs)
+        meta = pb_utils.Tensor("META", self._meta)
+        return [
+            pb_utils.InferenceResponse(output_tensors=[
+                pb_utils.Tensor("SCORES", scores[i:i + 1]), meta,
+            ])
+            for i in range(len(ctxs))
+        ]
 
     def execute(self, requests):
-        responses = []
-        for request in requests:
-            in_tensor = pb_utils.get_input_tensor_by_name(request, "INPUT")
-            raw = in_tensor.as_numpy()[0].decode("utf-8")
-            try:
-                ctx = json.loads(raw)
-            except Exception:
-                ctx = {}
-
-            score, model_name = self._score(ctx)
-            result = {
-                "confidence_score": round(score, 4),
-                "risk_score": round(1.0 - score, 4),
-                "model": model_name,
-                "backend": "triton-python",
-                "trained": self._trained,
-            }
-            out_bytes = json.dumps(result).encode("utf-8")
-            out_tensor = pb_utils.Tensor("OUTPUT", np.array([out_bytes], dtype=object))
-            responses.append(pb_utils.InferenceResponse(output_tensors=[out_tensor]))
-        return responses
+        ctxs = [_parse_input(request) for request in requests]
+        try:
+            return self._build_responses(ctxs)
+        except Exception as e:
+            error = pb_utils.TritonError(f"risk-scorer: {e}")
+            return [pb_utils.InferenceResponse(error=error) for _ in requests]
 
     def finalize(self):
         pass